@@ -1,4 +1,6 @@
+from copy import deepcopy
 from typing import Dict, List, Union
+from weakref import WeakKeyDictionary
 
 from django.db.models import Q, QuerySet, Value
 from django.http import QueryDict
@@ -63,6 +65,30 @@ class UnknownFieldRaisesExceptionSerializerMixin:
         return data
 
 
+class CachedFieldsSerializerMixin:
+    """
+    Mixin to a DRF serializer class to build the serializer fields only once per
+    class. DRF calls `get_fields` every time a serializer is instantiated, which for a
+    `ModelSerializer` means introspecting the model and constructing every field
+    again. The constructed fields are stored per class, and a deep copy is returned
+    for every instance because DRF binds the fields to their parent serializer.
+
+    Only use this mixin for serializers that are instantiated directly and whose
+    fields don't depend on the instance, the context or the request. Serializer
+    classes that are generated per call won't benefit from it.
+    """
+
+    _cached_fields: "WeakKeyDictionary[type, Dict]" = WeakKeyDictionary()
+
+    def get_fields(self):
+        fields = self._cached_fields.get(self.__class__)
+        if fields is None:
+            fields = super().get_fields()
+            self._cached_fields[self.__class__] = fields
+
+        return {name: deepcopy(field) for name, field in fields.items()}
+
+
 class SearchableViewMixin:
     """
     This mixin can be used to add search functionality to a view. The view must
@@ -1,12 +1,44 @@
+from functools import wraps
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
 from django.conf import settings
+from django.middleware.http import ConditionalGetMiddleware
 from django.utils.decorators import method_decorator
+from django.utils.translation import get_language
 from django.views.decorators.cache import cache_page, never_cache
 
 from drf_spectacular.views import SpectacularJSONAPIView as ParentSpectacularJSONAPIView
+from rest_framework.response import Response
+
+
+def conditional_rendered_page(view_func):
+    """
+    Works like Django's `conditional_page` decorator, but renders the response first.
+    The responses returned by `cache_page` are already rendered, in which case the
+    result of a post render callback is ignored and the 304 response would never be
+    returned. Rendering first also makes sure that a 304 response is never cached
+    instead of the full response.
+    """
+
+    middleware = ConditionalGetMiddleware(view_func)
+
+    @wraps(view_func)
+    def _wrapped_view(request, *args, **kwargs):
+        response = view_func(request, *args, **kwargs)
+        if hasattr(response, "render") and callable(response.render):
+            response = response.render()
+        return middleware.process_response(request, response)
+
+    return _wrapped_view
 
 
 @method_decorator(
-    cache_page(60 * 60 * 24 * 7) if not settings.DEBUG else never_cache, name="dispatch"
+    [
+        conditional_rendered_page,
+        cache_page(60 * 60 * 24 * 7) if not settings.DEBUG else never_cache,
+    ],
+    name="dispatch",
 )
 class CachedSpectacularJSONAPIView(ParentSpectacularJSONAPIView):
     """
@@ -17,4 +49,32 @@ class CachedSpectacularJSONAPIView(ParentSpectacularJSONAPIView):
     version, the older cache entries must not be left dangling. The response is only
     cached if settings.DEBUG is False, because it can be confusing for other devs if
     their changes are not applied in the schema.
+
+    Next to the shared cache, the generated schema is also kept in memory per API
+    version and language so that a cache miss, for example because the shared cache
+    has been cleared, doesn't regenerate it. The response gets an ETag, so clients
+    that already have the schema get a 304 response.
     """
+
+    _schemas: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]] = {}
+    _schemas_lock = Lock()
+
+    def _get_schema_response(self, request):
+        if settings.DEBUG:
+            return super()._get_schema_response(request)
+
+        version = (
+            self.api_version or request.version or self._get_version_parameter(request)
+        )
+        key = (version, get_language())
+
+        with self._schemas_lock:
+            if key not in self._schemas:
+                response = super()._get_schema_response(request)
+                self._schemas[key] = {
+                    "data": response.data,
+                    "headers": {"Content-Disposition": response["Content-Disposition"]},
+                }
+            schema = self._schemas[key]
+
+        return Response(data=schema["data"], headers=schema["headers"])
@@ -28,52 +28,63 @@ from .workspaces import urls as workspace_urls
 app_name = "baserow.api"
 
 
-urlpatterns = (
-    [
-        path("schema.json", CachedSpectacularJSONAPIView.as_view(), name="json_schema"),
-        path(
-            "redoc/",
-            SpectacularRedocView.as_view(url_name="api:json_schema"),
-            name="redoc",
+urlpatterns = [
+    path("schema.json", CachedSpectacularJSONAPIView.as_view(), name="json_schema"),
+    path(
+        "redoc/",
+        SpectacularRedocView.as_view(url_name="api:json_schema"),
+        name="redoc",
+    ),
+    path("settings/", include(settings_urls, namespace="settings")),
+    path("auth-provider/", include(auth_provider_urls, namespace="auth_provider")),
+    path("user/", include(user_urls, namespace="user")),
+    path("user-files/", include(user_files_urls, namespace="user_files")),
+    path("workspaces/", include(workspace_urls, namespace="workspaces")),
+    # The current and the compat urls sharing the same prefix are grouped in one
+    # include, so that the resolver can skip the whole subtree if the prefix doesn't
+    # match.
+    path(
+        "templates/",
+        include(
+            [
+                path("", include(templates_urls, namespace="templates")),
+                path("", include(templates_compat_urls, namespace="templates_compat")),
+            ]
         ),
-        path("settings/", include(settings_urls, namespace="settings")),
-        path("auth-provider/", include(auth_provider_urls, namespace="auth_provider")),
-        path("user/", include(user_urls, namespace="user")),
-        path("user-files/", include(user_files_urls, namespace="user_files")),
-        path("workspaces/", include(workspace_urls, namespace="workspaces")),
-        path("templates/", include(templates_urls, namespace="templates")),
-        path("applications/", include(application_urls, namespace="applications")),
-        path("trash/", include(trash_urls, namespace="trash")),
-        path("jobs/", include(jobs_urls, namespace="jobs")),
-        path("snapshots/", include(snapshots_urls, namespace="snapshots")),
-        path("_health/", include(health_urls, namespace="health")),
-        # GroupDeprecation
-        path("groups/", include(group_compat_urls, namespace="groups")),
-        path(
-            "applications/",
-            include(application_compat_urls, namespace="applications_compat"),
+    ),
+    path(
+        "applications/",
+        include(
+            [
+                path("", include(application_urls, namespace="applications")),
+                path(
+                    "",
+                    include(application_compat_urls, namespace="applications_compat"),
+                ),
+            ]
         ),
-        path("trash/", include(trash_compat_urls, namespace="trash_compat")),
-        path(
-            "templates/", include(templates_compat_urls, namespace="templates_compat")
+    ),
+    path(
+        "trash/",
+        include(
+            [
+                path("", include(trash_urls, namespace="trash")),
+                path("", include(trash_compat_urls, namespace="trash_compat")),
+            ]
         ),
-        path("notifications/", include(notifications_urls, namespace="notifications")),
-    ]
-    + application_type_registry.api_urls
-    + plugin_registry.api_urls
-)
-
+    ),
+    path("jobs/", include(jobs_urls, namespace="jobs")),
+    path("snapshots/", include(snapshots_urls, namespace="snapshots")),
+    path("_health/", include(health_urls, namespace="health")),
+    # GroupDeprecation
+    path("groups/", include(group_compat_urls, namespace="groups")),
+    path("notifications/", include(notifications_urls, namespace="notifications")),
+    path("", include(application_type_registry.api_urls)),
+    path("", include(plugin_registry.api_urls)),
+]
 
 if "builder" in settings.FEATURE_FLAGS:
-    urlpatterns.append(
-        path(
-            "",
-            include(integrations_urls, namespace="integrations"),
-        )
-    )
-    urlpatterns.append(
-        path(
-            "",
-            include(user_source_urls, namespace="user_sources"),
-        )
-    )
+    urlpatterns += [
+        path("", include(integrations_urls, namespace="integrations")),
+        path("", include(user_source_urls, namespace="user_sources")),
+    ]
@@ -1,4 +1,5 @@
 from django.core.asgi import get_asgi_application
+from django.urls import get_resolver
 
 from channels.routing import ProtocolTypeRouter
 
@@ -14,6 +15,13 @@ django_asgi_app = get_asgi_application()
 # logging setup. Otherwise Django will try to destroy and log handlers we added prior.
 setup_logging()
 
+# Import the url patterns and build the reverse lookup of the resolver now, so that
+# the first request doesn't have to do it. Accessing these properties is enough to
+# populate the cached resolver.
+resolver = get_resolver()
+resolver.url_patterns
+resolver.reverse_dict
+
 application = ProtocolTypeRouter(
     {"http": django_asgi_app, "websocket": websocket_router}
 )
@@ -8,6 +8,7 @@ https://docs.djangoproject.com/en/2.2/howto/deployment/wsgi/
 """
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 from baserow.core.telemetry.telemetry import setup_logging, setup_telemetry
 
@@ -19,3 +20,10 @@ application = get_wsgi_application()
 # It is critical to setup our own logging after django has been setup and done its own
 # logging setup. Otherwise Django will try to destroy and log handlers we added prior.
 setup_logging()
+
+# Import the url patterns and build the reverse lookup of the resolver now, so that
+# the first request doesn't have to do it. Accessing these properties is enough to
+# populate the cached resolver.
+resolver = get_resolver()
+resolver.url_patterns
+resolver.reverse_dict
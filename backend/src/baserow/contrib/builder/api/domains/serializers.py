@@ -1,4 +1,4 @@
-from typing import List
+from typing import FrozenSet, List, Tuple
 
 from django.utils.functional import lazy
 
@@ -6,6 +6,7 @@ from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
+from baserow.api.mixins import CachedFieldsSerializerMixin
 from baserow.api.services.serializers import PublicServiceSerializer
 from baserow.contrib.builder.api.pages.serializers import PathParamSerializer
 from baserow.contrib.builder.api.theme.serializers import (
@@ -21,6 +22,22 @@ from baserow.contrib.builder.models import Builder
 from baserow.contrib.builder.pages.models import Page
 from baserow.core.services.registries import service_type_registry
 
+DOMAIN_NAME_HELP_TEXT = Domain._meta.get_field("domain_name").help_text
+DATA_SOURCE_NAME_HELP_TEXT = DataSource._meta.get_field("name").help_text
+DATA_SOURCE_PAGE_HELP_TEXT = DataSource._meta.get_field("page").help_text
+DATA_SOURCE_ORDER_HELP_TEXT = DataSource._meta.get_field("order").help_text
+
+
+def get_domain_type_choices() -> Tuple[str, ...]:
+    """
+    Returns the available domain type names. The names are cached by the registry
+    until a domain type is registered or unregistered.
+
+    :return: A tuple containing the domain type names.
+    """
+
+    return domain_type_registry.get_type_choices()
+
 
 class DomainSerializer(serializers.ModelSerializer):
     type = serializers.SerializerMethodField(help_text="The type of the domain.")
@@ -41,7 +58,7 @@ class DomainSerializer(serializers.ModelSerializer):
 
 class CreateDomainSerializer(serializers.ModelSerializer):
     type = serializers.ChoiceField(
-        choices=lazy(domain_type_registry.get_types, list)(),
+        choices=lazy(get_domain_type_choices, tuple)(),
         required=True,
         help_text="The type of the domain.",
     )
@@ -56,14 +73,12 @@ class CreateDomainSerializer(serializers.ModelSerializer):
 
 class UpdateDomainSerializer(serializers.ModelSerializer):
     type = serializers.ChoiceField(
-        choices=lazy(domain_type_registry.get_types, list)(),
+        choices=lazy(get_domain_type_choices, tuple)(),
         required=False,
         help_text="The type of the domain.",
     )
 
-    domain_name = serializers.CharField(
-        required=False, help_text=Domain._meta.get_field("domain_name").help_text
-    )
+    domain_name = serializers.CharField(required=False, help_text=DOMAIN_NAME_HELP_TEXT)
 
     class Meta:
         model = Domain
@@ -85,12 +100,58 @@ class PublicElementSerializer(serializers.ModelSerializer):
     Basic element serializer mostly for returned values.
     """
 
+    # The fields of these classes represent the model attribute as is, so they can be
+    # read directly from the instance.
+    plain_attribute_field_classes = (
+        serializers.IntegerField,
+        serializers.CharField,
+        serializers.ReadOnlyField,
+    )
+
     type = serializers.SerializerMethodField(help_text="The type of the element.")
 
     @extend_schema_field(OpenApiTypes.STR)
     def get_type(self, instance):
         return element_type_registry.get_by_model(instance.specific_class).type
 
+    def _get_plain_attribute_field_names(
+        self,
+    ) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+        """
+        Returns the names of the readable fields whose representation is the model
+        attribute itself, both in order and as a set. Most of the element fields are
+        simple style properties, reading them directly from the instance avoids going
+        through the `get_attribute` and `to_representation` methods of every field for
+        every element. The names are computed once per generated serializer class.
+        """
+
+        cls = self.__class__
+        if "_plain_attribute_field_names" not in cls.__dict__:
+            names = tuple(
+                field.field_name
+                for field in super()._readable_fields
+                if type(field) in self.plain_attribute_field_classes
+                and field.source == field.field_name
+            )
+            cls._plain_attribute_field_names = (names, frozenset(names))
+        return cls._plain_attribute_field_names
+
+    @property
+    def _readable_fields(self):
+        _, plain_attribute_field_names = self._get_plain_attribute_field_names()
+        for field in super()._readable_fields:
+            if field.field_name not in plain_attribute_field_names:
+                yield field
+
+    def to_representation(self, instance):
+        plain_attribute_field_names, _ = self._get_plain_attribute_field_names()
+        data = {
+            field_name: getattr(instance, field_name)
+            for field_name in plain_attribute_field_names
+        }
+        data.update(super().to_representation(instance))
+        return data
+
     class Meta:
         model = Element
         fields = (
@@ -121,7 +182,7 @@ class PublicElementSerializer(serializers.ModelSerializer):
         }
 
 
-class PublicPageSerializer(serializers.ModelSerializer):
+class PublicPageSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """
     A public version of the page serializer with less data to prevent data leaks.
     """
@@ -138,7 +199,7 @@ class PublicPageSerializer(serializers.ModelSerializer):
         }
 
 
-class PublicBuilderSerializer(serializers.ModelSerializer):
+class PublicBuilderSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """
     A public version of the builder serializer with less data to prevent data leaks.
     """
@@ -168,9 +229,31 @@ class PublicBuilderSerializer(serializers.ModelSerializer):
         :return: A list of serialized pages that belong to this instance.
         """
 
-        pages = instance.page_set.all()
-
-        return PublicPageSerializer(pages, many=True).data
+        # The pages are serialized by hand because this endpoint is called for
+        # every visit of a published builder. The output must stay identical to
+        # the `PublicPageSerializer` used in the schema. Prefetched pages are
+        # reused, otherwise only the needed columns are fetched without creating
+        # model instances.
+        if "page_set" in getattr(instance, "_prefetched_objects_cache", {}):
+            pages = [
+                (page.id, page.name, page.path, page.path_params)
+                for page in instance.page_set.all()
+            ]
+        else:
+            pages = instance.page_set.values_list("id", "name", "path", "path_params")
+
+        return [
+            {
+                "id": page_id,
+                "name": name,
+                "path": path,
+                "path_params": [
+                    {"name": path_param["name"], "type": path_param["type"]}
+                    for path_param in path_params
+                ],
+            }
+            for page_id, name, path, path_params in pages
+        ]
 
     @extend_schema_field(OpenApiTypes.STR)
     def get_type(self, instance: Builder) -> str:
@@ -181,21 +264,33 @@ class PublicBuilderSerializer(serializers.ModelSerializer):
         return serialize_builder_theme(instance)
 
 
+@extend_schema_field(OpenApiTypes.FLOAT)
+class PublicDataSourceOrderField(serializers.FloatField):
+    """
+    A float field documented with the `float` format instead of the `double` format
+    of the default float field mapping.
+    """
+
+
 class PublicDataSourceSerializer(PublicServiceSerializer):
     """
     Basic data_source serializer mostly for returned values. This serializer flatten the
     service properties so that from an API POV the data_source object only exists.
+
+    The `id`, `name`, `page_id` and `order` fields are taken from the data source
+    provided in the context. They are declared for the schema only and are set at
+    once in `to_representation` instead of being resolved field by field.
     """
 
-    id = serializers.SerializerMethodField(help_text="Data source id.")
-    name = serializers.SerializerMethodField(
-        help_text=DataSource._meta.get_field("name").help_text
-    )
-    page_id = serializers.SerializerMethodField(
-        help_text=DataSource._meta.get_field("page").help_text
+    data_source_field_names = ("id", "name", "page_id", "order")
+
+    id = serializers.IntegerField(read_only=True, help_text="Data source id.")
+    name = serializers.CharField(read_only=True, help_text=DATA_SOURCE_NAME_HELP_TEXT)
+    page_id = serializers.IntegerField(
+        read_only=True, help_text=DATA_SOURCE_PAGE_HELP_TEXT
     )
-    order = serializers.SerializerMethodField(
-        help_text=DataSource._meta.get_field("order").help_text
+    order = PublicDataSourceOrderField(
+        read_only=True, help_text=DATA_SOURCE_ORDER_HELP_TEXT
     )
     type = serializers.SerializerMethodField(help_text="The type of the data source.")
 
@@ -206,21 +301,22 @@ class PublicDataSourceSerializer(PublicServiceSerializer):
         else:
             return service_type_registry.get_by_model(instance.specific_class).type
 
-    @extend_schema_field(OpenApiTypes.INT)
-    def get_id(self, instance):
-        return self.context["data_source"].id
-
-    @extend_schema_field(OpenApiTypes.STR)
-    def get_name(self, instance):
-        return self.context["data_source"].name
-
-    @extend_schema_field(OpenApiTypes.INT)
-    def get_page_id(self, instance):
-        return self.context["data_source"].page_id
-
-    @extend_schema_field(OpenApiTypes.FLOAT)
-    def get_order(self, instance):
-        return self.context["data_source"].order
+    @property
+    def _readable_fields(self):
+        for field in super()._readable_fields:
+            if field.field_name not in self.data_source_field_names:
+                yield field
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        data_source = self.context["data_source"]
+        data.update(
+            id=data_source.id,
+            name=data_source.name,
+            page_id=data_source.page_id,
+            order=data_source.order,
+        )
+        return data
 
     class Meta(PublicServiceSerializer.Meta):
         fields = PublicServiceSerializer.Meta.fields + ("name", "page_id", "order")
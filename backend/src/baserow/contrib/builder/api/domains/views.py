@@ -496,10 +496,19 @@ class PublicElementsView(APIView):
 
         elements = ElementService().get_elements(request.user, page)
 
-        data = [
-            element_type_registry.get_serializer(element, PublicElementSerializer).data
-            for element in elements
-        ]
+        # The serializer class is generated once per element type, so that the
+        # fields it reads directly from the elements are only computed once.
+        serializer_classes = {}
+        data = []
+        for element in elements:
+            element_type = element.get_type()
+            serializer_class = serializer_classes.get(element_type.type)
+            if serializer_class is None:
+                serializer_class = element_type.get_serializer_class(
+                    base_class=PublicElementSerializer
+                )
+                serializer_classes[element_type.type] = serializer_class
+            data.append(serializer_class(element.specific).data)
         return Response(data)
 
 
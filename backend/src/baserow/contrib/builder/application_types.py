@@ -12,7 +12,6 @@ from django.utils.translation import gettext as _
 from baserow.contrib.builder.constants import IMPORT_SERIALIZED_IMPORTING
 from baserow.contrib.builder.models import Builder
 from baserow.contrib.builder.pages.handler import PageHandler
-from baserow.contrib.builder.pages.models import Page
 from baserow.contrib.builder.pages.service import PageService
 from baserow.contrib.builder.theme.handler import ThemeHandler
 from baserow.contrib.builder.theme.registries import theme_config_block_registry
@@ -22,6 +21,7 @@ from baserow.core.integrations.models import Integration
 from baserow.core.models import Application, Workspace
 from baserow.core.registries import ApplicationType, ImportExportConfig
 from baserow.core.user_sources.handler import UserSourceHandler
+from baserow.core.user_sources.models import UserSource
 from baserow.core.utils import ChildProgressBuilder
 
 
@@ -69,6 +69,10 @@ class BuilderApplicationType(ApplicationType):
         be imported via the `import_serialized`.
         """
 
+        # The parts below are deliberately exported one after the other. They must
+        # all be read in the transaction opened by `export_safe_transaction_context`
+        # to get a consistent view of the builder, and a database transaction can't
+        # be shared with other threads because they use their own connection.
         serialized_integrations = [
             IntegrationHandler().export_integration(i)
             for i in IntegrationHandler().get_integrations(builder)
@@ -79,9 +83,7 @@ class BuilderApplicationType(ApplicationType):
             for us in UserSourceHandler().get_user_sources(builder)
         ]
 
-        pages = builder.page_set.all().prefetch_related("element_set", "datasource_set")
-
-        serialized_pages = [PageHandler().export_page(p) for p in pages]
+        serialized_pages = PageHandler().export_pages(builder.page_set.all())
 
         serialized_theme = ThemeHandler().export_theme(builder)
 
@@ -105,7 +107,8 @@ class BuilderApplicationType(ApplicationType):
         files_zip: Optional[ZipFile] = None,
         storage: Optional[Storage] = None,
         progress_builder: Optional[ChildProgressBuilder] = None,
-    ) -> List[Page]:
+        cache: Optional[Dict[str, Any]] = None,
+    ) -> List[Integration]:
         """
         Import integrations to builder. This method has to be compatible with the output
         of `export_integrations_serialized`.
@@ -116,6 +119,7 @@ class BuilderApplicationType(ApplicationType):
         :param progress_builder: A progress builder that allows for publishing progress.
         :param files_zip: An optional zip file for the related files.
         :param storage: The storage instance.
+        :param cache: A cache shared with the other parts of the same import.
         :return: The created integration instances.
         """
 
@@ -123,20 +127,18 @@ class BuilderApplicationType(ApplicationType):
             progress_builder, child_total=len(serialized_integrations)
         )
 
-        imported_integrations: List[Integration] = []
-
-        for serialized_integration in serialized_integrations:
-            integration = IntegrationHandler().import_integration(
-                builder,
-                serialized_integration,
-                id_mapping,
-                cache=self.cache,
-                files_zip=files_zip,
-                storage=storage,
-            )
-            imported_integrations.append(integration)
+        imported_integrations = IntegrationHandler().import_integrations(
+            builder,
+            serialized_integrations,
+            id_mapping,
+            cache=cache,
+            files_zip=files_zip,
+            storage=storage,
+        )
 
-            progress.increment(state=IMPORT_SERIALIZED_IMPORTING)
+        progress.increment(
+            state=IMPORT_SERIALIZED_IMPORTING, by=len(serialized_integrations)
+        )
 
         return imported_integrations
 
@@ -148,7 +150,8 @@ class BuilderApplicationType(ApplicationType):
         files_zip: Optional[ZipFile] = None,
         storage: Optional[Storage] = None,
         progress_builder: Optional[ChildProgressBuilder] = None,
-    ) -> List[Page]:
+        cache: Optional[Dict[str, Any]] = None,
+    ) -> List[UserSource]:
         """
         Import user sources to builder.
 
@@ -158,6 +161,7 @@ class BuilderApplicationType(ApplicationType):
         :param progress_builder: A progress builder that allows for publishing progress.
         :param files_zip: An optional zip file for the related files.
         :param storage: The storage instance.
+        :param cache: A cache shared with the other parts of the same import.
         :return: The created user sources instances.
         """
 
@@ -165,20 +169,18 @@ class BuilderApplicationType(ApplicationType):
             progress_builder, child_total=len(serialized_user_sources)
         )
 
-        imported_user_sources: List[Integration] = []
-
-        for serialized_user_source in serialized_user_sources:
-            integration = UserSourceHandler().import_user_source(
-                builder,
-                serialized_user_source,
-                id_mapping,
-                cache=self.cache,
-                files_zip=files_zip,
-                storage=storage,
-            )
-            imported_user_sources.append(integration)
+        imported_user_sources = UserSourceHandler().import_user_sources(
+            builder,
+            serialized_user_sources,
+            id_mapping,
+            cache=cache,
+            files_zip=files_zip,
+            storage=storage,
+        )
 
-            progress.increment(state=IMPORT_SERIALIZED_IMPORTING)
+        progress.increment(
+            state=IMPORT_SERIALIZED_IMPORTING, by=len(serialized_user_sources)
+        )
 
         return imported_user_sources
 
@@ -196,7 +198,9 @@ class BuilderApplicationType(ApplicationType):
         Imports a builder application exported by the `export_serialized` method.
         """
 
-        self.cache = {}
+        # The cache is local to this import so that concurrent imports don't share
+        # state through the application type instance, which is a singleton.
+        cache = {}
 
         serialized_pages = serialized_values.pop("pages")
         serialized_integrations = serialized_values.pop("integrations")
@@ -243,6 +247,7 @@ class BuilderApplicationType(ApplicationType):
                 files_zip,
                 storage,
                 progress.create_child_builder(represents_progress=integration_progress),
+                cache=cache,
             )
 
         if not serialized_user_sources:
@@ -257,6 +262,7 @@ class BuilderApplicationType(ApplicationType):
                 files_zip,
                 storage,
                 progress.create_child_builder(represents_progress=user_source_progress),
+                cache=cache,
             )
 
         if not serialized_pages:
@@ -79,14 +79,14 @@ class DataSourceHandler:
 
     def get_data_sources(
         self,
-        page: Page,
+        page: Optional[Page] = None,
         base_queryset: Optional[QuerySet] = None,
         specific: bool = True,
     ) -> Union[QuerySet[DataSource], Iterable[DataSource]]:
         """
         Gets all the specific data_sources of a given page.
 
-        :param page: The page that holds the data_sources.
+        :param page: The page that holds the data_sources if provided.
         :param base_queryset: The base queryset to use to build the query.
         :param specific: If True, return the specific version of the service related
           to the integration
@@ -97,7 +97,10 @@ class DataSourceHandler:
             base_queryset if base_queryset is not None else DataSource.objects.all()
         )
 
-        data_source_queryset = data_source_queryset.filter(page=page).select_related(
+        if page is not None:
+            data_source_queryset = data_source_queryset.filter(page=page)
+
+        data_source_queryset = data_source_queryset.select_related(
             "service",
             "page",
             "page__builder",
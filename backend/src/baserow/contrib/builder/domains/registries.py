@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 from baserow.core.registry import (
     CustomFieldsInstanceMixin,
@@ -30,5 +30,23 @@ class DomainTypeRegistry(Registry, ModelRegistryMixin, CustomFieldsRegistryMixin
 
     name = "domain_type"
 
+    _type_choices: Optional[Tuple[str, ...]] = None
+
+    def get_type_choices(self) -> Tuple[str, ...]:
+        """
+        Returns the names of the registered domain types. The result is cached until
+        a domain type is registered or unregistered.
+
+        :return: A tuple containing the domain type names.
+        """
+
+        if self._type_choices is None:
+            self._type_choices = tuple(self.get_types())
+        return self._type_choices
+
+    def _clear_lookup_caches(self):
+        super()._clear_lookup_caches()
+        self._type_choices = None
+
 
 domain_type_registry = DomainTypeRegistry()
@@ -1,5 +1,7 @@
+from bisect import bisect_right
 from collections import defaultdict
-from typing import Any, Dict, Iterable, List, Optional, Union, cast
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
 from zipfile import ZipFile
 
 from django.core.files.storage import Storage
@@ -21,7 +23,7 @@ from baserow.core.utils import MirrorDict, extract_allowed
 
 from ..workflow_actions.models import BuilderWorkflowAction
 from ..workflow_actions.registries import builder_workflow_action_type_registry
-from .types import ElementForUpdate, ElementsAndWorkflowActions
+from .types import ElementDictSubClass, ElementForUpdate, ElementsAndWorkflowActions
 
 
 class ElementHandler:
@@ -82,7 +84,7 @@ class ElementHandler:
         try:
             element = (
                 queryset.select_related(
-                    "page", "page__builder", "page__builder__workspace"
+                    "content_type", "page", "page__builder", "page__builder__workspace"
                 )
                 .get(id=element_id)
                 .specific
@@ -115,14 +117,14 @@ class ElementHandler:
 
     def get_elements(
         self,
-        page: Page,
+        page: Optional[Page] = None,
         base_queryset: Optional[QuerySet] = None,
         specific: bool = True,
     ) -> Union[QuerySet[Element], Iterable[Element]]:
         """
         Gets all the specific elements of a given page.
 
-        :param page: The page that holds the elements.
+        :param page: The page that holds the elements if provided.
         :param base_queryset: The base queryset to use to build the query.
         :param specific: Whether to return the generic elements or the specific
             instances.
@@ -131,7 +133,8 @@ class ElementHandler:
 
         queryset = base_queryset if base_queryset is not None else Element.objects.all()
 
-        queryset = queryset.filter(page=page)
+        if page is not None:
+            queryset = queryset.filter(page=page)
 
         if specific:
             queryset = queryset.select_related("content_type")
@@ -206,20 +209,22 @@ class ElementHandler:
         :return: The updated element.
         """
 
+        element_type = element.get_type()
+
         allowed_updates = extract_allowed(
-            kwargs, self.allowed_fields_update + element.get_type().allowed_fields
+            kwargs, self.allowed_fields_update + element_type.allowed_fields
         )
 
-        allowed_updates = element.get_type().prepare_value_for_db(
+        allowed_updates = element_type.prepare_value_for_db(
             allowed_updates, instance=element
         )
 
         for key, value in allowed_updates.items():
             setattr(element, key, value)
 
-        element.save()
+        element.save(update_fields=[*allowed_updates.keys(), "updated_on"])
 
-        element.get_type().after_update(element, kwargs)
+        element_type.after_update(element, kwargs)
 
         return element
 
@@ -247,6 +252,8 @@ class ElementHandler:
         parent_element_id = getattr(parent_element, "id", None)
 
         if parent_element is not None and place_in_container is not None:
+            # This costs an additional query if the parent element isn't a specific
+            # instance yet, which is acceptable because only one element is moved.
             parent_element = parent_element.specific
             parent_element_type = element_type_registry.get_by_model(parent_element)
             parent_element_type.validate_place_in_container(
@@ -265,7 +272,14 @@ class ElementHandler:
         element.parent_element = parent_element
         element.place_in_container = place_in_container
 
-        element.save()
+        element.save(
+            update_fields=[
+                "order",
+                "parent_element",
+                "place_in_container",
+                "updated_on",
+            ]
+        )
 
         return element
 
@@ -306,14 +320,16 @@ class ElementHandler:
 
         element_type = element_type_registry.get_by_model(container_element)
 
-        elements_being_moved = Element.objects.filter(
-            parent_element=container_element,
-            place_in_container__in=places,
+        elements_being_moved = list(
+            element_type.apply_order_by_children(
+                Element.objects.filter(
+                    parent_element=container_element,
+                    place_in_container__in=places,
+                )
+            )
         )
 
-        element_count = elements_being_moved.count()
-
-        if element_count == 0:
+        if len(elements_being_moved) == 0:
             return []
 
         new_place_in_container = element_type.get_new_place_in_container(
@@ -324,22 +340,17 @@ class ElementHandler:
             container_element.page,
             container_element.id,
             new_place_in_container,
-            amount=element_count,
+            amount=len(elements_being_moved),
         )
 
-        elements_being_moved = element_type.apply_order_by_children(
-            elements_being_moved
-        )
-        elements_being_moved = list(elements_being_moved)
-
-        to_update = []
-        for element in elements_being_moved:
-            # Add order values in the same order
-            element.order = new_order_values.pop(0)
+        # Add order values in the same order
+        for element, new_order in zip(elements_being_moved, new_order_values):
+            element.order = new_order
             element.place_in_container = new_place_in_container
-            to_update.append(element)
 
-        Element.objects.bulk_update(to_update, ["order", "place_in_container"])
+        Element.objects.bulk_update(
+            elements_being_moved, ["order", "place_in_container"]
+        )
 
         return elements_being_moved
 
@@ -362,7 +373,11 @@ class ElementHandler:
         :return: All the workflow actions associated
         """
 
-        return specific_iterator(element.builderworkflowaction_set.all())
+        return specific_iterator(
+            element.builderworkflowaction_set.select_related("content_type").order_by(
+                "order", "id"
+            )
+        )
 
     def duplicate_element(self, element: Element) -> ElementsAndWorkflowActions:
         """
@@ -375,13 +390,82 @@ class ElementHandler:
         """
 
         # We are just creating new elements here so other data id should remain
-        id_mapping = defaultdict(lambda: MirrorDict())
+        id_mapping = defaultdict(MirrorDict)
+
+        # The elements of the page are fetched once, so that the children and the
+        # next sibling of every duplicated element can be found without executing
+        # queries for every element. They're fetched via the page so that the page
+        # doesn't have to be fetched again when the next sibling is used.
+        children_by_parent = defaultdict(list)
+        siblings_by_place = defaultdict(list)
+        for page_element in element.page.element_set.only(
+            "id", "page_id", "parent_element_id", "place_in_container", "order"
+        ):
+            children_by_parent[page_element.parent_element_id].append(page_element)
+            siblings_by_place[
+                (page_element.parent_element_id, page_element.place_in_container)
+            ].append(page_element)
+        sibling_orders_by_place = {
+            place: [sibling.order for sibling in siblings]
+            for place, siblings in siblings_by_place.items()
+        }
 
-        return self._duplicate_element_recursive(element, id_mapping)
+        element_ids = [element.id]
+        for element_id in element_ids:
+            element_ids += [child.id for child in children_by_parent[element_id]]
+
+        # The descendants are fetched in their specific form with one query per
+        # element type, instead of one query per element.
+        specific_descendants = {
+            descendant.id: descendant
+            for descendant in specific_iterator(
+                Element.objects.filter(id__in=element_ids[1:]).select_related(
+                    "content_type", "page"
+                )
+            )
+        }
+        for element_id in element_ids:
+            children_by_parent[element_id] = [
+                specific_descendants[child.id]
+                for child in children_by_parent[element_id]
+            ]
+
+        workflow_actions = (
+            BuilderWorkflowAction.objects.filter(element_id__in=element_ids)
+            .select_related("content_type")
+            .order_by("order", "id")
+        )
+        workflow_actions_by_element = defaultdict(list)
+        for workflow_action in specific_iterator(workflow_actions):
+            workflow_actions_by_element[workflow_action.element_id].append(
+                workflow_action
+            )
+
+        duplicated = ElementsAndWorkflowActions(elements=[], workflow_actions=[])
+        self._duplicate_element_recursive(
+            element,
+            id_mapping,
+            children_by_parent,
+            siblings_by_place,
+            sibling_orders_by_place,
+            workflow_actions_by_element,
+            duplicated,
+        )
+
+        return duplicated
 
     def _duplicate_element_recursive(
-        self, element: Element, id_mapping
-    ) -> ElementsAndWorkflowActions:
+        self,
+        element: Element,
+        id_mapping,
+        children_by_parent: Dict[Optional[int], List[Element]],
+        siblings_by_place: Dict[Tuple[Optional[int], Optional[str]], List[Element]],
+        sibling_orders_by_place: Dict[
+            Tuple[Optional[int], Optional[str]], List[Decimal]
+        ],
+        workflow_actions_by_element: Dict[int, List[BuilderWorkflowAction]],
+        duplicated: ElementsAndWorkflowActions,
+    ):
         """
         Duplicates an element and all of its children.
 
@@ -390,22 +474,27 @@ class ElementHandler:
 
         :param element: The element being duplicated
         :param id_mapping: The id_mapping dict used for export/import process
-        :return: A list of duplicated elements
+        :param children_by_parent: The elements of the page by parent element id. The
+            children of the duplicated elements are specific instances.
+        :param siblings_by_place: The elements of the page by parent element id and
+            place in container.
+        :param sibling_orders_by_place: The orders of the `siblings_by_place`
+            elements, used to find the next sibling with a binary search.
+        :param workflow_actions_by_element: The workflow actions of the duplicated
+            elements by element id.
+        :param duplicated: The duplicated elements and workflow actions are added to
+            the lists of this dict, so that they don't have to be merged for every
+            level of the recursion.
         """
 
         element_type = element_type_registry.get_by_model(element)
 
         serialized = element_type.export_serialized(element)
 
-        next_element = (
-            element.page.element_set.filter(
-                parent_element_id=element.parent_element_id,
-                place_in_container=element.place_in_container,
-                order__gt=element.order,
-            )
-            .exclude(id=element.id)
-            .first()
-        )
+        place = (element.parent_element_id, element.place_in_container)
+        siblings = siblings_by_place[place]
+        next_index = bisect_right(sibling_orders_by_place.get(place, []), element.order)
+        next_element = siblings[next_index] if next_index < len(siblings) else None
 
         if next_element:
             # The duplicated element will be inserted right after the current one
@@ -422,35 +511,35 @@ class ElementHandler:
                 element.place_in_container,
             )
 
+        # The elements are created one by one via their element type because they
+        # use multi table inheritance, which can't be bulk created, and because the
+        # element types can create related objects like the collection fields.
         element_duplicated = element_type.import_serialized(
             element.page, serialized, id_mapping
         )
 
         workflow_actions_duplicated = self._duplicate_workflow_actions_of_element(
-            element, id_mapping
+            element, workflow_actions_by_element[element.id], id_mapping
         )
 
-        elements_and_workflow_actions_duplicated = {
-            "elements": [element_duplicated],
-            "workflow_actions": workflow_actions_duplicated,
-        }
-
-        for child in element.children.all():
-            children_duplicated = self._duplicate_element_recursive(
-                child.specific, id_mapping
+        duplicated["elements"].append(element_duplicated)
+        duplicated["workflow_actions"].extend(workflow_actions_duplicated)
+
+        for child in children_by_parent[element.id]:
+            self._duplicate_element_recursive(
+                child,
+                id_mapping,
+                children_by_parent,
+                siblings_by_place,
+                sibling_orders_by_place,
+                workflow_actions_by_element,
+                duplicated,
             )
-            elements_and_workflow_actions_duplicated["elements"] += children_duplicated[
-                "elements"
-            ]
-            elements_and_workflow_actions_duplicated[
-                "workflow_actions"
-            ] += children_duplicated["workflow_actions"]
-
-        return elements_and_workflow_actions_duplicated
 
     def _duplicate_workflow_actions_of_element(
         self,
         element: Element,
+        workflow_actions: List[BuilderWorkflowAction],
         id_mapping: Dict[str, Dict[int, int]],
     ) -> List[BuilderWorkflowAction]:
         """
@@ -458,12 +547,13 @@ class ElementHandler:
         element.
 
         :param element: The original element
-        :param element_duplicated: The duplicated reference of the original element
+        :param workflow_actions: The specific workflow actions of the element.
+        :param id_mapping: The id_mapping dict used for export/import process
         """
 
         workflow_actions_duplicated = []
 
-        for workflow_action in self.get_element_workflow_actions(element):
+        for workflow_action in workflow_actions:
             workflow_action_type = builder_workflow_action_type_registry.get_by_model(
                 workflow_action
             )
@@ -493,7 +583,35 @@ class ElementHandler:
         :return: The serialized version.
         """
 
-        return element.get_type().export_serialized(element)
+        return self.export_elements([element], files_zip=files_zip, storage=storage)[0]
+
+    def export_elements(
+        self,
+        elements: Iterable[Element],
+        files_zip: Optional[ZipFile] = None,
+        storage: Optional[Storage] = None,
+    ) -> List[ElementDictSubClass]:
+        """
+        Serializes the given specific elements. The element type is only looked up
+        once per element class.
+
+        :param elements: The instances to serialize.
+        :param files_zip: A zip file to store files in necessary.
+        :param storage: Storage to use.
+        :return: The serialized versions in the same order as the provided elements.
+        """
+
+        element_types = {}
+        serialized_elements = []
+        for element in elements:
+            element_class = type(element)
+            if element_class not in element_types:
+                element_types[element_class] = element.get_type()
+            serialized_elements.append(
+                element_types[element_class].export_serialized(element)
+            )
+
+        return serialized_elements
 
     def import_element(
         self,
@@ -516,16 +634,47 @@ class ElementHandler:
         :return: the newly created instance.
         """
 
+        return self.import_elements(
+            page,
+            [serialized_element],
+            id_mapping,
+            files_zip=files_zip,
+            storage=storage,
+        )[0]
+
+    def import_elements(
+        self,
+        page: Page,
+        serialized_elements: List[Dict[str, Any]],
+        id_mapping: Dict[str, Dict[int, int]],
+        files_zip: Optional[ZipFile] = None,
+        storage: Optional[Storage] = None,
+    ) -> List[Element]:
+        """
+        Creates the instances using the serialized versions previously exported with
+        `.export_elements'. The parent elements must be provided before their
+        children.
+
+        :param page: The page instance the new elements should belong to.
+        :param serialized_elements: The serialized versions of the elements.
+        :param id_mapping: A map of old->new id per data type
+            when we have foreign keys that need to be migrated.
+        :param files_zip: Contains files to import if any.
+        :param storage: Storage to get the files from.
+        :return: the newly created instances.
+        """
+
         if "builder_page_elements" not in id_mapping:
             id_mapping["builder_page_elements"] = {}
+        element_id_mapping = id_mapping["builder_page_elements"]
 
-        element_type = element_type_registry.get(serialized_element["type"])
-        created_instance = element_type.import_serialized(
-            page, serialized_element, id_mapping
-        )
-
-        id_mapping["builder_page_elements"][
-            serialized_element["id"]
-        ] = created_instance.id
+        created_instances = []
+        for serialized_element in serialized_elements:
+            element_type = element_type_registry.get(serialized_element["type"])
+            created_instance = element_type.import_serialized(
+                page, serialized_element, id_mapping
+            )
+            element_id_mapping[serialized_element["id"]] = created_instance.id
+            created_instances.append(created_instance)
 
-        return created_instance
+        return created_instances
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from zipfile import ZipFile
 
 from django.core.files.storage import Storage
@@ -8,7 +8,9 @@ from django.db.models import QuerySet
 
 from baserow.contrib.builder.constants import IMPORT_SERIALIZED_IMPORTING
 from baserow.contrib.builder.data_sources.handler import DataSourceHandler
+from baserow.contrib.builder.data_sources.models import DataSource
 from baserow.contrib.builder.elements.handler import ElementHandler
+from baserow.contrib.builder.elements.models import Element
 from baserow.contrib.builder.elements.registries import element_type_registry
 from baserow.contrib.builder.elements.types import ElementDictSubClass
 from baserow.contrib.builder.models import Builder
@@ -32,6 +34,7 @@ from baserow.contrib.builder.types import PageDict
 from baserow.contrib.builder.workflow_actions.handler import (
     BuilderWorkflowActionHandler,
 )
+from baserow.contrib.builder.workflow_actions.models import BuilderWorkflowAction
 from baserow.core.exceptions import IdDoesNotExist
 from baserow.core.utils import ChildProgressBuilder, MirrorDict, find_unused_name
 
@@ -195,7 +198,7 @@ class PageHandler:
 
         progress.increment(by=export_progress)
 
-        id_mapping = defaultdict(lambda: MirrorDict())
+        id_mapping = defaultdict(MirrorDict)
         id_mapping["builder_pages"] = MirrorDict()
 
         new_page_clone = self.import_page(
@@ -343,7 +346,7 @@ class PageHandler:
         page: Page,
         files_zip: Optional[ZipFile] = None,
         storage: Optional[Storage] = None,
-    ) -> List[PageDict]:
+    ) -> PageDict:
         """
         Serializes the given page.
 
@@ -353,38 +356,77 @@ class PageHandler:
         :return: The serialized version.
         """
 
-        # Get serialized version of all elements of the current page
-        serialized_elements = [
-            ElementHandler().export_element(e, files_zip=files_zip, storage=storage)
-            for e in ElementHandler().get_elements(page=page)
-        ]
+        return self.export_pages([page], files_zip=files_zip, storage=storage)[0]
+
+    def export_pages(
+        self,
+        pages: Iterable[Page],
+        files_zip: Optional[ZipFile] = None,
+        storage: Optional[Storage] = None,
+    ) -> List[PageDict]:
+        """
+        Serializes the given pages. The elements, workflow actions and data sources
+        of all the pages are fetched at once instead of once per page.
+
+        :param pages: The instances to serialize.
+        :param files_zip: A zip file to store files in necessary.
+        :param storage: Storage to use.
+        :return: The serialized versions in the same order as the provided pages.
+        """
+
+        pages = list(pages)
+        page_ids = [page.id for page in pages]
 
-        # Get serialized versions of all workflow actions of the current page
-        serialized_workflow_actions = [
-            BuilderWorkflowActionHandler().export_workflow_action(
-                wa, files_zip=files_zip, storage=storage
+        # Get serialized version of all elements of the pages
+        elements = list(
+            ElementHandler().get_elements(
+                base_queryset=Element.objects.filter(page_id__in=page_ids)
+            )
+        )
+        serialized_elements = defaultdict(list)
+        for element, serialized_element in zip(
+            elements,
+            ElementHandler().export_elements(
+                elements, files_zip=files_zip, storage=storage
+            ),
+        ):
+            serialized_elements[element.page_id].append(serialized_element)
+
+        # Get serialized versions of all workflow actions of the pages
+        serialized_workflow_actions = defaultdict(list)
+        for workflow_action in BuilderWorkflowActionHandler().get_workflow_actions(
+            base_queryset=BuilderWorkflowAction.objects.filter(page_id__in=page_ids)
+        ):
+            serialized_workflow_actions[workflow_action.page_id].append(
+                BuilderWorkflowActionHandler().export_workflow_action(
+                    workflow_action, files_zip=files_zip, storage=storage
+                )
             )
-            for wa in BuilderWorkflowActionHandler().get_workflow_actions(page=page)
-        ]
 
-        # Get serialized version of all data_sources for the current page
-        serialized_data_sources = [
-            DataSourceHandler().export_data_source(
-                ds, files_zip=files_zip, storage=storage
+        # Get serialized version of all data_sources of the pages
+        serialized_data_sources = defaultdict(list)
+        for data_source in DataSourceHandler().get_data_sources(
+            base_queryset=DataSource.objects.filter(page_id__in=page_ids)
+        ):
+            serialized_data_sources[data_source.page_id].append(
+                DataSourceHandler().export_data_source(
+                    data_source, files_zip=files_zip, storage=storage
+                )
             )
-            for ds in DataSourceHandler().get_data_sources(page=page)
-        ]
 
-        return PageDict(
-            id=page.id,
-            name=page.name,
-            order=page.order,
-            path=page.path,
-            path_params=page.path_params,
-            elements=serialized_elements,
-            data_sources=serialized_data_sources,
-            workflow_actions=serialized_workflow_actions,
-        )
+        return [
+            PageDict(
+                id=page.id,
+                name=page.name,
+                order=page.order,
+                path=page.path,
+                path_params=page.path_params,
+                elements=serialized_elements[page.id],
+                data_sources=serialized_data_sources[page.id],
+                workflow_actions=serialized_workflow_actions[page.id],
+            )
+            for page in pages
+        ]
 
     def _ops_count_for_import_page(
         self,
@@ -557,7 +599,10 @@ class PageHandler:
                 files_zip=files_zip,
                 storage=storage,
             )
-            progress.increment(state=IMPORT_SERIALIZED_IMPORTING)
+
+        progress.increment(
+            by=len(serialized_data_sources), state=IMPORT_SERIALIZED_IMPORTING
+        )
 
     def import_elements(
         self,
@@ -604,6 +649,7 @@ class PageHandler:
 
         while was_imported:
             was_imported = False
+            imported_count = 0
 
             for serialized_element in prioritized_elements:
                 parent_element_id = serialized_element["parent_element_id"]
@@ -625,8 +671,12 @@ class PageHandler:
                         )
                     )
                     was_imported = True
-                    if progress:
-                        progress.increment(state=IMPORT_SERIALIZED_IMPORTING)
+                    imported_count += 1
+
+            # The progress is incremented once per pass instead of once per element
+            # because publishing the progress is expensive compared to the import.
+            if progress and imported_count:
+                progress.increment(by=imported_count, state=IMPORT_SERIALIZED_IMPORTING)
 
         return imported_elements
 
@@ -655,4 +705,7 @@ class PageHandler:
             BuilderWorkflowActionHandler().import_workflow_action(
                 page, serialized_workflow_action, id_mapping
             )
-            progress.increment(state=IMPORT_SERIALIZED_IMPORTING)
+
+        progress.increment(
+            by=len(serialized_workflow_actions), state=IMPORT_SERIALIZED_IMPORTING
+        )
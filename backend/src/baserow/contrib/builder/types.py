@@ -48,6 +48,9 @@ class PageDict(TypedDict):
     workflow_actions: List[WorkflowAction]
 
 
+# The serialized builder is deliberately a plain dict. The application exports are
+# modified in place by the duplicate and template code, merged with the data of the
+# serialization processors and written together with the other applications.
 class BuilderDict(TypedDict):
     id: int
     name: str
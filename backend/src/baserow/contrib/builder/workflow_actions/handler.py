@@ -32,12 +32,12 @@ class BuilderWorkflowActionHandler(WorkflowActionHandler):
     registry = builder_workflow_action_type_registry
 
     def get_workflow_actions(
-        self, page: Page, base_queryset: Optional[QuerySet] = None
+        self, page: Optional[Page] = None, base_queryset: Optional[QuerySet] = None
     ) -> Iterable[WorkflowAction]:
         """
         Get all the workflow actions of an page
 
-        :param page: The page associated with the workflow actions
+        :param page: The page associated with the workflow actions if provided
         :param base_queryset: Optional base queryset to filter the results
         :return: A list of workflow actions
         """
@@ -45,7 +45,8 @@ class BuilderWorkflowActionHandler(WorkflowActionHandler):
         if base_queryset is None:
             base_queryset = self.model.objects
 
-        base_queryset = base_queryset.filter(page=page)
+        if page is not None:
+            base_queryset = base_queryset.filter(page=page)
 
         return super().get_all_workflow_actions(base_queryset)
 
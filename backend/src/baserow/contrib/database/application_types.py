@@ -112,7 +112,9 @@ class DatabaseApplicationType(ApplicationType):
                 row_queryset = row_queryset.select_related("created_by")
             if table.last_modified_by_column_added:
                 row_queryset = row_queryset.select_related("last_modified_by")
-            for row in row_queryset:
+            # Iterate in chunks so that the row instances of large tables don't all
+            # have to be in memory next to their serialized version.
+            for row in row_queryset.iterator(chunk_size=2000):
                 serialized_row = DatabaseExportSerializedStructure.row(
                     id=row.id,
                     order=str(row.order),
@@ -34,6 +34,7 @@ from django.db.models import (
     Window,
 )
 from django.db.models.functions import Coalesce, RowNumber
+from django.utils.functional import cached_property
 
 from dateutil import parser
 from dateutil.parser import ParserError
@@ -193,11 +194,25 @@ from .utils.duration import (
     DURATION_FORMAT_TOKENS,
     DURATION_FORMATS,
     convert_duration_input_value_to_timedelta,
+    get_duration_search_expression,
     prepare_duration_value_for_db,
 )
 
 User = get_user_model()
 
+# Only the id, first_name and email of the user referenced by the created by and last
+# modified by fields are used, so the other columns don't have to be selected.
+UNUSED_COLLABORATOR_USER_COLUMNS = (
+    "password",
+    "last_login",
+    "is_superuser",
+    "username",
+    "last_name",
+    "is_staff",
+    "is_active",
+    "date_joined",
+)
+
 if TYPE_CHECKING:
     from baserow.contrib.database.fields.dependencies.update_collector import (
         FieldUpdateCollector,
@@ -240,8 +255,10 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
     def regex(self):
         pass
 
-    @property
+    @cached_property
     def validator(self):
+        # Field types are singletons in the registry, so the validator and its
+        # compiled regex are created once instead of every time a value is checked.
         return UnicodeRegexValidator(regex_value=self.regex)
 
     def prepare_value_for_db(self, instance, value):
@@ -343,7 +360,12 @@ class CharFieldMatchingRegexFieldType(TextFieldMatchingRegexFieldType):
 
 class ManyToManyFieldTypeSerializeToInputValueMixin:
     def serialize_to_input_value(self, field: Field, value: any) -> any:
-        return [v.id for v in value.all()]
+        queryset = value.all()
+        # The ids can be read from the related objects if they have been prefetched,
+        # otherwise only the ids are selected instead of the whole related objects.
+        if queryset._result_cache is not None:
+            return [v.id for v in queryset]
+        return list(queryset.values_list("id", flat=True))
 
     def random_to_input_value(self, field: Field, value: any) -> any:
         return value
@@ -474,7 +496,8 @@ class NumberFieldType(FieldType):
     _can_group_by = True
 
     def prepare_value_for_db(self, instance, value):
-        if value is not None:
+        # Decimals are immutable, so existing ones don't have to be copied.
+        if value is not None and type(value) is not Decimal:
             value = Decimal(value)
 
         if value is not None and not instance.number_negative and value < 0:
@@ -512,9 +535,12 @@ class NumberFieldType(FieldType):
         if instance.number_decimal_places == 0:
             return int(value)
 
-        # DRF's Decimal Serializer knows how to quantize and format the decimal
-        # correctly so lets use it instead of trying to do it ourselves.
-        return self.get_serializer_field(instance).to_representation(value)
+        # Formatting the decimal with a fixed number of decimal places rounds it the
+        # same way DRF's DecimalField quantizes it, without creating a serializer
+        # field, exponent or decimal context for every exported value.
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value).strip())
+        return format(value, f".{instance.number_decimal_places}f")
 
     def get_model_field(self, instance, **kwargs):
         kwargs["decimal_places"] = instance.number_decimal_places
@@ -670,13 +696,7 @@ class RatingFieldType(FieldType):
                 )
 
             if from_field_type.type == "boolean":
-                return """
-                    IF p_in THEN
-                        p_in = 1;
-                    ELSE
-                        p_in = 0;
-                    END IF;
-                """
+                return "p_in = CASE WHEN p_in::boolean THEN 1 ELSE 0 END;"
 
         return super().get_alter_column_prepare_new_value(
             connection, from_field, to_field
@@ -733,6 +753,9 @@ class BooleanFieldType(FieldType):
     type = "boolean"
     model_class = BooleanField
     _can_group_by = True
+    _true_values_sql = ",".join(
+        "'%s'" % str(v).replace("'", "''") for v in BASEROW_BOOLEAN_FIELD_TRUE_VALUES
+    )
 
     def get_alter_column_prepare_new_value(self, connection, from_field, to_field):
         """
@@ -741,14 +764,9 @@ class BooleanFieldType(FieldType):
         'checked' or to one of the serializers.BooleanField.TRUE_VALUES.
         """
 
-        true_values = ",".join(["'%s'" % v for v in BASEROW_BOOLEAN_FIELD_TRUE_VALUES])
-        return f"""
-            IF lower(p_in::text) IN ({true_values}) THEN
-                p_in = TRUE;
-            ELSE
-                p_in = FALSE;
-            END IF;
-        """
+        return (
+            f"p_in = coalesce(lower(p_in::text) IN ({self._true_values_sql}), FALSE);"
+        )
 
     def get_serializer_field(self, instance, **kwargs):
         return BaserowBooleanField(**{"required": False, "default": False, **kwargs})
@@ -811,6 +829,10 @@ class DateFieldType(FieldType):
         DateForceTimezoneOffsetValueError: ERROR_DATE_FORCE_TIMEZONE_OFFSET_ERROR
     }
     _can_group_by = True
+    _parser_kwargs_by_date_format = {
+        "EU": {"dayfirst": True},
+        "ISO": {"yearfirst": True},
+    }
 
     def can_represent_date(self, field):
         return True
@@ -925,27 +947,23 @@ class DateFieldType(FieldType):
 
         if isinstance(value, str):
             try:
-                # Try first to parse isodate
-                value = parser.isoparse(value)
-            except Exception:
-                try:
-                    if instance.date_format == "EU":
-                        value = parser.parse(value, dayfirst=True)
-                    elif instance.date_format == "ISO":
-                        value = parser.parse(value, yearfirst=True)
-                    else:
-                        value = parser.parse(value)
-                except ParserError as exc:
-                    raise ValidationError(
-                        "The provided string could not converted to a date.",
-                        code="invalid",
-                    ) from exc
+                # The ISO format that Baserow itself produces can be parsed by the
+                # much faster `fromisoformat`. Before Python 3.11 it doesn't accept
+                # the `Z` suffix, so that one is replaced by the UTC offset.
+                value = datetime.fromisoformat(
+                    value[:-1] + "+00:00" if value.endswith("Z") else value
+                )
+            except ValueError:
+                value = self._parse_date_string(instance, value)
 
         if isinstance(value, date) and not isinstance(value, datetime):
             value = datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
 
         if isinstance(value, datetime):
-            value = value.astimezone(timezone.utc)
+            # Most values, like the ones parsed above, are already in UTC, so the
+            # conversion can be skipped for them.
+            if value.tzinfo is not timezone.utc:
+                value = value.astimezone(timezone.utc)
             return value if instance.date_include_time else value.date()
 
         raise ValidationError(
@@ -953,15 +971,44 @@ class DateFieldType(FieldType):
             code="invalid",
         )
 
+    def _parse_date_string(self, instance, value: str) -> datetime:
+        try:
+            # Try first to parse isodate
+            return parser.isoparse(value)
+        except Exception:
+            try:
+                return parser.parse(
+                    value,
+                    **self._parser_kwargs_by_date_format.get(instance.date_format, {}),
+                )
+            except ParserError as exc:
+                raise ValidationError(
+                    "The provided string could not converted to a date.",
+                    code="invalid",
+                ) from exc
+
     def get_export_value(self, value, field_object, rich_value=False):
         if value is None:
             return value if rich_value else ""
 
-        field = field_object["field"]
-        if isinstance(value, datetime) and field.date_force_timezone is not None:
-            value = value.astimezone(ZoneInfo(field.date_force_timezone))
+        # The format and timezone are the same for every value of the field, so they
+        # are only computed for the first value and stored on the field object.
+        try:
+            python_format, force_timezone = field_object["_date_export_options"]
+        except KeyError:
+            field = field_object["field"]
+            python_format = field.get_python_format()
+            force_timezone = (
+                ZoneInfo(field.date_force_timezone)
+                if field.date_force_timezone is not None
+                else None
+            )
+            field_object["_date_export_options"] = (python_format, force_timezone)
+
+        if isinstance(value, datetime) and force_timezone is not None:
+            value = value.astimezone(force_timezone)
 
-        return value.strftime(field.get_python_format())
+        return value.strftime(python_format)
 
     def get_serializer_field(self, instance, **kwargs):
         required = kwargs.get("required", False)
@@ -985,7 +1032,7 @@ class DateFieldType(FieldType):
 
     def random_value(self, instance, fake, cache):
         if instance.date_include_time:
-            return fake.date_time().replace(tzinfo=timezone.utc)
+            return datetime.fromtimestamp(fake.unix_time(), tz=timezone.utc)
         else:
             return fake.date_object()
 
@@ -1230,8 +1277,10 @@ class CreatedOnLastModifiedBaseFieldType(ReadOnlyFieldType, DateFieldType):
         """
 
         if not isinstance(from_field, self.model_class):
-            to_model.objects.all().update(
-                **{f"{to_field.db_column}": models.F(self.source_field_name)}
+            # Rows that already hold the source value don't have to be rewritten.
+            source = models.F(self.source_field_name)
+            to_model.objects.exclude(**{f"{to_field.db_column}": source}).update(
+                **{f"{to_field.db_column}": source}
             )
 
     def set_import_serialized_value(
@@ -1343,12 +1392,16 @@ class LastModifiedByFieldType(ReadOnlyFieldType):
         """
 
         if not isinstance(from_field, self.model_class):
-            to_model.objects.all().update(
-                **{f"{to_field.db_column}": models.F(self.source_field_name)}
+            # Rows that already hold the source value don't have to be rewritten.
+            source = models.F(self.source_field_name)
+            to_model.objects.exclude(**{f"{to_field.db_column}": source}).update(
+                **{f"{to_field.db_column}": source}
             )
 
     def enhance_queryset(self, queryset, field, name):
-        return queryset.select_related(name)
+        return queryset.select_related(name).defer(
+            *[f"{name}__{column}" for column in UNUSED_COLLABORATOR_USER_COLUMNS]
+        )
 
     def should_backup_field_data_for_same_type_update(
         self, old_field, new_field_attrs: Dict[str, Any]
@@ -1429,10 +1482,10 @@ class LastModifiedByFieldType(ReadOnlyFieldType):
         return collate_expression(Value(value.first_name))
 
     def get_search_expression(self, field: Field, queryset: QuerySet) -> Expression:
+        # Look up the user by the primary key stored in the row, instead of joining
+        # the table with itself, because the expression is also used in updates.
         return Subquery(
-            queryset.filter(pk=OuterRef("pk")).values(f"{field.db_column}__first_name")[
-                :1
-            ]
+            User.objects.filter(pk=OuterRef(field.db_column)).values("first_name")[:1]
         )
 
     def contains_query(self, field_name, value, model_field, field):
@@ -1548,12 +1601,16 @@ class CreatedByFieldType(ReadOnlyFieldType):
         """
 
         if not isinstance(from_field, self.model_class):
-            to_model.objects.all().update(
-                **{f"{to_field.db_column}": models.F(self.source_field_name)}
+            # Rows that already hold the source value don't have to be rewritten.
+            source = models.F(self.source_field_name)
+            to_model.objects.exclude(**{f"{to_field.db_column}": source}).update(
+                **{f"{to_field.db_column}": source}
             )
 
     def enhance_queryset(self, queryset, field, name):
-        return queryset.select_related(name)
+        return queryset.select_related(name).defer(
+            *[f"{name}__{column}" for column in UNUSED_COLLABORATOR_USER_COLUMNS]
+        )
 
     def should_backup_field_data_for_same_type_update(
         self, old_field, new_field_attrs: Dict[str, Any]
@@ -1634,10 +1691,10 @@ class CreatedByFieldType(ReadOnlyFieldType):
         return collate_expression(Value(value.first_name))
 
     def get_search_expression(self, field: Field, queryset: QuerySet) -> Expression:
+        # Look up the user by the primary key stored in the row, instead of joining
+        # the table with itself, because the expression is also used in updates.
         return Subquery(
-            queryset.filter(pk=OuterRef("pk")).values(f"{field.db_column}__first_name")[
-                :1
-            ]
+            User.objects.filter(pk=OuterRef(field.db_column)).values("first_name")[:1]
         )
 
     def contains_query(self, field_name, value, model_field, field):
@@ -1716,14 +1773,7 @@ class DurationFieldType(FieldType):
         return prepare_duration_value_for_db(value, instance.duration_format)
 
     def get_search_expression(self, field: Field, queryset: QuerySet) -> Expression:
-        search_exprs = []
-        for token in field.duration_format.split(":"):
-            search_expr = DURATION_FORMAT_TOKENS[token]["search_expr"](field.db_column)
-            search_exprs.append(search_expr)
-        separators = [Value(" ")] * len(search_exprs)
-        # interleave a separator between each extract_expr
-        exprs = [expr for pair in zip(search_exprs, separators) for expr in pair][:-1]
-        return Func(*exprs, function="CONCAT")
+        return get_duration_search_expression(field.duration_format, field.db_column)
 
     def random_value(self, instance, fake, cache):
         random_seconds = fake.random.random() * 60 * 60 * 2
@@ -1791,6 +1841,15 @@ class DurationFieldType(FieldType):
         if value is None:
             return None
 
+        # The format function is the same for every value of the field, so it's only
+        # looked up for the first value and stored on the field object.
+        try:
+            format_func = field_object["_duration_format_func"]
+        except KeyError:
+            duration_format = field_object["field"].duration_format
+            format_func = DURATION_FORMATS[duration_format]["format_func"]
+            field_object["_duration_format_func"] = format_func
+
         secs_in_a_min = 60
         secs_in_an_hour = 60 * 60
 
@@ -1800,9 +1859,6 @@ class DurationFieldType(FieldType):
         mins = int(total_seconds % secs_in_an_hour / secs_in_a_min)
         secs = total_seconds % secs_in_a_min
 
-        field = field_object["field"]
-        duration_format = field.duration_format
-        format_func = DURATION_FORMATS[duration_format]["format_func"]
         return format_func(hours, mins, secs)
 
     def should_backup_field_data_for_same_type_update(
@@ -1952,12 +2008,12 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
         remote_model = queryset.model._meta.get_field(name).remote_field.model
         related_queryset = remote_model.objects.all()
 
-        try:
-            primary_field_object = next(
-                object
-                for object in remote_model._field_objects.values()
-                if object["field"].primary
-            )
+        primary_field_object = remote_model._field_objects.get(
+            remote_model._primary_field_id
+        )
+        # If the related model does not have a primary field then we also don't need
+        # to enhance the queryset.
+        if primary_field_object is not None:
             # Because we only need the primary value for serialization, we only have
             # to select and enhance that one. This will improve the performance of
             # large related tables significantly.
@@ -1967,10 +2023,6 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
                 primary_field_object["field"],
                 primary_field_object["name"],
             )
-        except StopIteration:
-            # If the related model does not have a primary field then we also don't
-            # need to enhance the queryset.
-            pass
 
         return queryset.prefetch_related(
             models.Prefetch(name, queryset=related_queryset)
@@ -1984,8 +2036,10 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
     def prepare_value_for_db_in_bulk(
         self, instance, values_by_row, continue_on_error=False
     ):
-        # Create a map {value -> row_indexes} for ids and strings
+        # Create a map {value -> row_indexes} for ids and strings, and keep track of
+        # the rows containing at least one name in the same pass.
         name_map = defaultdict(list)
+        rows_that_needs_name_replacement = set()
         invalid_values = []
         for row_index, values in values_by_row.items():
             for row_name_or_id in values:
@@ -1993,6 +2047,7 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
                     continue
                 elif isinstance(row_name_or_id, str):
                     name_map[row_name_or_id].append(row_index)
+                    rows_that_needs_name_replacement.add(row_index)
                 else:
                     invalid_values.append(values)
                     break
@@ -2042,48 +2097,57 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
                     raise error
 
             search_values = []
-            for name, row_ids in name_map.items():
-                try:
-                    search_values.append(
-                        primary_field_type.prepare_value_for_db(
-                            primary_field["field"], name
+            # The rows have already been replaced by an error if the primary field
+            # doesn't support text values, so there is nothing to look up.
+            if primary_field_type.can_get_unique_values:
+                for name, row_ids in name_map.items():
+                    try:
+                        search_values.append(
+                            primary_field_type.prepare_value_for_db(
+                                primary_field["field"], name
+                            )
                         )
-                    )
-                except ValidationError as e:
-                    error = ValidationError(
-                        f"The value '{name}' is an invalid value for the primary field "
-                        "of the linked table.",
-                        code="invalid_value",
-                    )
-                    if continue_on_error:
-                        # Replace values by error for failing rows
-                        for row_index in row_ids:
-                            values_by_row[row_index] = error
-                    else:
-                        raise e
-
-            # Get all matching rows
-            rows = related_model.objects.filter(
-                **{f"{primary_field['name']}__in": search_values}
-            )
-
-            # Map value with row id. Order is reversed to let the first row wins
-            # Values are mapped back to their string representation to be compared
-            # by the given text value
-            row_map = {
-                (
-                    str(
-                        primary_field["type"].get_export_value(
-                            getattr(r, primary_field["name"]), primary_field
+                    except ValidationError as e:
+                        error = ValidationError(
+                            f"The value '{name}' is an invalid value for the primary "
+                            "field of the linked table.",
+                            code="invalid_value",
                         )
+                        if continue_on_error:
+                            # Replace values by error for failing rows
+                            for row_index in row_ids:
+                                values_by_row[row_index] = error
+                        else:
+                            raise e
+
+            # Map value with row id. The first row wins if multiple rows have the same
+            # value. Values are mapped back to their string representation to be
+            # compared by the given text value
+            row_map = {}
+            if search_values:
+                # Get all matching rows. Only the primary value and the id are
+                # fetched, unless the primary field is a relation, like a single
+                # select, because then the related instance is needed to get the
+                # export value.
+                primary_field_name = primary_field["name"]
+                rows = related_model.objects.filter(
+                    **{f"{primary_field_name}__in": search_values}
+                )
+                model_field = related_model._meta.get_field(primary_field_name)
+                if model_field.is_relation:
+                    if model_field.many_to_one or model_field.one_to_one:
+                        rows = rows.select_related(primary_field_name)
+                    values_and_ids = (
+                        (getattr(r, primary_field_name), r.id) for r in rows
                     )
-                ): r.id
-                for r in rows[::-1]
-            }
+                else:
+                    values_and_ids = rows.values_list(primary_field_name, "id")
 
-            rows_that_needs_name_replacement = {
-                val for value in name_map.values() for val in value
-            }
+                get_export_value = primary_field["type"].get_export_value
+                for primary_value, row_id in values_and_ids:
+                    row_map.setdefault(
+                        str(get_export_value(primary_value, primary_field)), row_id
+                    )
 
             # Replace all row names with actual row ids
             for row_index in rows_that_needs_name_replacement:
@@ -2116,11 +2180,11 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
 
                 values_by_row[row_index] = new_values
 
-        # Removes duplicate ids keeping ordering
-        values_by_row = {
-            k: list(dict.fromkeys(v)) if isinstance(v, list) else v
-            for k, v in values_by_row.items()
-        }
+        # Removes duplicate ids keeping ordering. The rows are updated in place
+        # because the other values don't have to be copied.
+        for row_index, values in values_by_row.items():
+            if isinstance(values, list):
+                values_by_row[row_index] = list(dict.fromkeys(values))
         return values_by_row
 
     def get_export_value(self, value, field_object, rich_value=False):
@@ -2172,10 +2236,8 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
         else:
             related_model = instance.link_row_table.get_model()
 
-        primary_field = next(
-            object
-            for object in related_model._field_objects.values()
-            if object["field"].primary
+        primary_field = related_model._field_objects.get(
+            related_model._primary_field_id
         )
 
         return related_model, primary_field
@@ -1,4 +1,5 @@
 from datetime import timedelta
+from functools import lru_cache
 from typing import Optional, Union
 
 from django.core.exceptions import ValidationError
@@ -273,3 +274,26 @@ def prepare_duration_value_for_db(
             f"Value {value} is too large. The maximum is {timedelta.max}.",
             code="invalid",
         )
+
+
+@lru_cache(maxsize=256)
+def get_duration_search_expression(duration_format: str, field_name: str) -> Func:
+    """
+    Returns the expression that formats the duration stored in the provided field
+    according to the duration format, so that it can be searched. The tokens are
+    separated by a space. The expression only depends on the format and the field
+    name, so it's built once and reused for every query.
+
+    :param duration_format: The duration format of the field, like `h:mm:ss`.
+    :param field_name: The name of the column containing the duration.
+    :return: The expression concatenating the formatted tokens.
+    """
+
+    search_exprs = [
+        DURATION_FORMAT_TOKENS[token]["search_expr"](field_name)
+        for token in duration_format.split(":")
+    ]
+    separators = [Value(" ")] * len(search_exprs)
+    # interleave a separator between each extract_expr
+    exprs = [expr for pair in zip(search_exprs, separators) for expr in pair][:-1]
+    return Func(*exprs, function="CONCAT")
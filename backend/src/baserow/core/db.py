@@ -144,7 +144,8 @@ def specific_iterator(
     # type and construct a mapping containing them by id.
     specific_objects = {}
     for content_type, pks in types_and_pks.items():
-        model = content_type.model_class() or base_model
+        model_class = content_type.model_class()
+        model = model_class or base_model
         # We deliberately want to use the `_base_manager` here so it's works exactly
         # the same as the `.specific` property and so that trashed objects will still
         # be fetched.
@@ -154,6 +155,10 @@ def specific_iterator(
             objects = per_content_type_queryset_hook(model, objects)
 
         for object in objects:
+            # All the objects of this content type share the same specific class.
+            # Setting it upfront avoids resolving it via the content type again for
+            # every object when the `specific_class` property is accessed.
+            object.specific_class = model_class
             specific_objects[object.id] = object
 
     # Create an array with specific objects in the right order.
@@ -1,5 +1,4 @@
-from ast import Dict
-from typing import Iterable, Optional, Union, cast
+from typing import Any, Dict, Iterable, List, Optional, Union, cast
 from zipfile import ZipFile
 
 from django.core.files.storage import Storage
@@ -254,3 +253,42 @@ class IntegrationHandler:
         id_mapping["integrations"][serialized_integration["id"]] = integration.id
 
         return integration
+
+    def import_integrations(
+        self,
+        application: Application,
+        serialized_integrations: List[Dict[str, Any]],
+        id_mapping: Dict[str, Any],
+        cache: Optional[Dict] = None,
+        files_zip: Optional[ZipFile] = None,
+        storage: Optional[Storage] = None,
+    ) -> List[Integration]:
+        """
+        Imports all the given serialized integrations in the application with a
+        single call. The integration models use multi-table inheritance which can't be
+        bulk created, so each integration still gets its own insert, but the same
+        cache is shared across all of them.
+
+        :param application: The application the integrations are imported in.
+        :param serialized_integrations: The serialized integrations to import.
+        :param id_mapping: The map of exported ids to newly created ids.
+        :param cache: A cache shared between the imported integrations.
+        :param files_zip: An optional zip file for the related files.
+        :param storage: The storage instance.
+        :return: The created integration instances.
+        """
+
+        if cache is None:
+            cache = {}
+
+        return [
+            self.import_integration(
+                application,
+                serialized_integration,
+                id_mapping,
+                cache=cache,
+                files_zip=files_zip,
+                storage=storage,
+            )
+            for serialized_integration in serialized_integrations
+        ]
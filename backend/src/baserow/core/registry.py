@@ -595,6 +595,7 @@ class Registry(Generic[InstanceSubClass]):
             )
 
         self.registry[instance.type] = instance
+        self._clear_lookup_caches()
 
     def unregister(self, value: InstanceSubClass):
         """
@@ -614,11 +615,23 @@ class Registry(Generic[InstanceSubClass]):
 
         if isinstance(value, str):
             del self.registry[value]
+            self._clear_lookup_caches()
         else:
             raise ValueError(
                 f"The value must either be an {self.name} instance or " f"type name"
             )
 
+    def _clear_lookup_caches(self):
+        """
+        Clears the memoized lookups that depend on the registered instances. Must be
+        called every time the registry changes, otherwise a lookup could keep
+        returning an instance that has been unregistered or miss a more specific
+        instance that has been registered later on.
+        """
+
+        if isinstance(self, ModelRegistryMixin):
+            ModelRegistryMixin.get_for_class.cache_clear()
+
 
 class ModelRegistryMixin(Generic[DjangoModel, InstanceSubClass]):
     def get_by_model(
@@ -1,5 +1,4 @@
-from ast import Dict
-from typing import Iterable, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 from zipfile import ZipFile
 
 from django.core.files.storage import Storage
@@ -253,3 +252,42 @@ class UserSourceHandler:
         id_mapping["user_sources"][serialized_user_source["id"]] = user_source.id
 
         return user_source
+
+    def import_user_sources(
+        self,
+        application: Application,
+        serialized_user_sources: List[Dict[str, Any]],
+        id_mapping: Dict[str, Any],
+        cache: Optional[Dict] = None,
+        files_zip: Optional[ZipFile] = None,
+        storage: Optional[Storage] = None,
+    ) -> List[UserSource]:
+        """
+        Imports all the given serialized user sources in the application with a
+        single call. The user source models use multi-table inheritance which can't be
+        bulk created, so each user source still gets its own insert, but the same
+        cache is shared across all of them.
+
+        :param application: The application the user sources are imported in.
+        :param serialized_user_sources: The serialized user sources to import.
+        :param id_mapping: The map of exported ids to newly created ids.
+        :param cache: A cache shared between the imported user sources.
+        :param files_zip: An optional zip file for the related files.
+        :param storage: The storage instance.
+        :return: The created user source instances.
+        """
+
+        if cache is None:
+            cache = {}
+
+        return [
+            self.import_user_source(
+                application,
+                serialized_user_source,
+                id_mapping,
+                cache=cache,
+                files_zip=files_zip,
+                storage=storage,
+            )
+            for serialized_user_source in serialized_user_sources
+        ]
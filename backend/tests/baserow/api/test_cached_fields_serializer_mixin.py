@@ -0,0 +1,38 @@
+from unittest.mock import patch
+
+from rest_framework import serializers
+
+from baserow.api.mixins import CachedFieldsSerializerMixin
+
+
+class CachedTestSerializer(CachedFieldsSerializerMixin, serializers.Serializer):
+    name = serializers.CharField()
+    order = serializers.IntegerField()
+
+
+def test_cached_fields_serializer_mixin_builds_fields_once():
+    with patch.object(
+        serializers.Serializer,
+        "get_fields",
+        autospec=True,
+        side_effect=serializers.Serializer.get_fields,
+    ) as get_fields:
+        first = CachedTestSerializer()
+        second = CachedTestSerializer()
+
+        assert list(first.fields.keys()) == ["name", "order"]
+        assert list(second.fields.keys()) == ["name", "order"]
+
+    assert get_fields.call_count == 1
+    assert first.fields["name"] is not second.fields["name"]
+    assert first.fields["name"].parent is first
+    assert second.fields["name"].parent is second
+
+
+def test_cached_fields_serializer_mixin_representation():
+    serializer = CachedTestSerializer({"name": "Test", "order": 1})
+    assert serializer.data == {"name": "Test", "order": 1}
+
+    serializer = CachedTestSerializer(data={"name": "Other", "order": "2"})
+    assert serializer.is_valid()
+    assert serializer.validated_data == {"name": "Other", "order": 2}
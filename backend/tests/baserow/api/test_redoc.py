@@ -1,5 +1,5 @@
 from rest_framework.reverse import reverse
-from rest_framework.status import HTTP_200_OK
+from rest_framework.status import HTTP_200_OK, HTTP_304_NOT_MODIFIED
 
 
 def test_can_generate_open_api_schema(api_client):
@@ -9,3 +9,18 @@ def test_can_generate_open_api_schema(api_client):
     # The second request is going to be cached. This is to make sure that's working.
     response = api_client.get(reverse("api:json_schema"))
     assert response.status_code == HTTP_200_OK
+
+
+def test_open_api_schema_conditional_get(api_client):
+    response = api_client.get(reverse("api:json_schema"))
+    assert response.status_code == HTTP_200_OK
+    etag = response["ETag"]
+    assert etag
+
+    response = api_client.get(reverse("api:json_schema"), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+
+    # The not modified response must not be cached for the other clients.
+    response = api_client.get(reverse("api:json_schema"))
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["openapi"]
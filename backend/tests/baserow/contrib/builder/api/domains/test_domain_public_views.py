@@ -237,6 +237,63 @@ def test_get_elements_of_public_builder(api_client, data_fixture):
     assert len(response_json) == 3
 
 
+@pytest.mark.django_db
+def test_get_elements_of_public_builder_payload(api_client, data_fixture):
+    user = data_fixture.create_user()
+    builder_from = data_fixture.create_builder_application(user=user)
+    builder_to = data_fixture.create_builder_application(user=user, workspace=None)
+    page = data_fixture.create_builder_page(builder=builder_to, user=user)
+    element = data_fixture.create_builder_heading_element(
+        page=page,
+        value="'Title'",
+        level=2,
+        font_color="primary",
+        style_padding_top=5,
+        style_background_color="#ffffffff",
+    )
+
+    data_fixture.create_builder_custom_domain(
+        domain_name="test.getbaserow.io",
+        published_to=page.builder,
+        builder=builder_from,
+    )
+
+    url = reverse(
+        "api:builder:domains:list_elements",
+        kwargs={"page_id": page.id},
+    )
+    response = api_client.get(url, format="json")
+
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == [
+        {
+            "id": element.id,
+            "type": "heading",
+            "order": str(element.order),
+            "parent_element_id": None,
+            "place_in_container": None,
+            "style_border_top_color": "border",
+            "style_border_top_size": 0,
+            "style_padding_top": 5,
+            "style_border_bottom_color": "border",
+            "style_border_bottom_size": 0,
+            "style_padding_bottom": 10,
+            "style_border_left_color": "border",
+            "style_border_left_size": 0,
+            "style_padding_left": 20,
+            "style_border_right_color": "border",
+            "style_border_right_size": 0,
+            "style_padding_right": 20,
+            "style_background": "none",
+            "style_background_color": "#ffffffff",
+            "style_width": "normal",
+            "value": "'Title'",
+            "level": 2,
+            "font_color": "primary",
+        }
+    ]
+
+
 @pytest.mark.django_db
 def test_get_elements_of_public_builder_permission_denied(api_client, data_fixture):
     user = data_fixture.create_user()
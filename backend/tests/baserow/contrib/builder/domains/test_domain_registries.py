@@ -0,0 +1,16 @@
+from baserow.contrib.builder.domains.domain_types import CustomDomainType, SubDomainType
+from baserow.contrib.builder.domains.registries import DomainTypeRegistry
+
+
+def test_domain_type_choices_are_updated_when_the_registry_changes():
+    registry = DomainTypeRegistry()
+    assert registry.get_type_choices() == ()
+
+    registry.register(CustomDomainType())
+    assert registry.get_type_choices() == ("custom",)
+
+    registry.register(SubDomainType())
+    assert registry.get_type_choices() == ("custom", "sub_domain")
+
+    registry.unregister("custom")
+    assert registry.get_type_choices() == ("sub_domain",)
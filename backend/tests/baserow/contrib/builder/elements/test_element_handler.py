@@ -12,6 +12,7 @@ from baserow.contrib.builder.elements.exceptions import (
 )
 from baserow.contrib.builder.elements.handler import ElementHandler
 from baserow.contrib.builder.elements.models import (
+    ColumnElement,
     Element,
     HeadingElement,
     ParagraphElement,
@@ -509,3 +510,59 @@ def test_duplicate_element_with_workflow_action_in_container(data_fixture):
     ]
     assert duplicated_workflow_action1.page_id == workflow_action1.page_id
     assert duplicated_workflow_action2.page_id == workflow_action2.page_id
+
+
+@pytest.mark.django_db
+def test_duplicate_element_is_placed_before_next_sibling(data_fixture):
+    page = data_fixture.create_builder_page()
+    container_element = data_fixture.create_builder_column_element(
+        column_amount=2, page=page
+    )
+    child = data_fixture.create_builder_paragraph_element(
+        parent_element=container_element, place_in_container="0", page=page, order=1
+    )
+    next_child = data_fixture.create_builder_paragraph_element(
+        parent_element=container_element, place_in_container="0", page=page, order=2
+    )
+    data_fixture.create_builder_paragraph_element(
+        parent_element=container_element, place_in_container="1", page=page, order=3
+    )
+
+    [child_duplicated] = ElementHandler().duplicate_element(child)["elements"]
+
+    assert child_duplicated.parent_element_id == container_element.id
+    assert child_duplicated.place_in_container == "0"
+    assert child.order < child_duplicated.order < next_child.order
+
+
+@pytest.mark.django_db
+def test_export_and_import_elements(data_fixture):
+    page = data_fixture.create_builder_page()
+    container_element = data_fixture.create_builder_column_element(
+        column_amount=2, page=page
+    )
+    child = data_fixture.create_builder_paragraph_element(
+        value="'test'", parent_element=container_element, page=page
+    )
+
+    serialized_elements = ElementHandler().export_elements([container_element, child])
+
+    assert [e["id"] for e in serialized_elements] == [container_element.id, child.id]
+    assert [e["type"] for e in serialized_elements] == ["column", "paragraph"]
+
+    id_mapping = {}
+    other_page = data_fixture.create_builder_page(builder=page.builder)
+    [
+        container_element_imported,
+        child_imported,
+    ] = ElementHandler().import_elements(other_page, serialized_elements, id_mapping)
+
+    assert isinstance(container_element_imported, ColumnElement)
+    assert isinstance(child_imported, ParagraphElement)
+    assert container_element_imported.page_id == other_page.id
+    assert child_imported.parent_element_id == container_element_imported.id
+    assert child_imported.value == "'test'"
+    assert id_mapping["builder_page_elements"] == {
+        container_element.id: container_element_imported.id,
+        child.id: child_imported.id,
+    }
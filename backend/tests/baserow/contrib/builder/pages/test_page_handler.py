@@ -340,3 +340,35 @@ def test_import_element_has_to_instance_already_created(data_fixture):
 
     assert imported_paragraph.parent_element_id != paragraph_element.parent_element_id
     assert imported_paragraph.parent_element_id == imported_column.id
+
+
+@pytest.mark.django_db
+def test_export_pages(data_fixture):
+    page = data_fixture.create_builder_page()
+    other_page = data_fixture.create_builder_page(builder=page.builder)
+    heading = data_fixture.create_builder_heading_element(page=page)
+    paragraph = data_fixture.create_builder_paragraph_element(page=other_page)
+    data_source = data_fixture.create_builder_data_source(page=other_page)
+    workflow_action = data_fixture.create_notification_workflow_action(
+        page=page, element=heading
+    )
+
+    [serialized_page, serialized_other_page] = PageHandler().export_pages(
+        [page, other_page]
+    )
+
+    assert serialized_page["id"] == page.id
+    assert [e["id"] for e in serialized_page["elements"]] == [heading.id]
+    assert serialized_page["data_sources"] == []
+    assert [wa["id"] for wa in serialized_page["workflow_actions"]] == [
+        workflow_action.id
+    ]
+
+    assert serialized_other_page["id"] == other_page.id
+    assert [e["id"] for e in serialized_other_page["elements"]] == [paragraph.id]
+    assert [ds["id"] for ds in serialized_other_page["data_sources"]] == [
+        data_source.id
+    ]
+    assert serialized_other_page["workflow_actions"] == []
+
+    assert PageHandler().export_page(other_page) == serialized_other_page
@@ -30,6 +30,7 @@ def test_alter_boolean_field_column_type(data_fixture):
         "false": False,
         "off": False,
         "Random text": False,
+        None: False,
     }
 
     for value in mapping.keys():
@@ -466,3 +466,27 @@ def test_created_by_field_type_sorting(data_fixture):
     rows = view_handler.apply_sorting(grid_view, model.objects.all())
     row_ids = [row.id for row in rows]
     assert row_ids == [row1.id, row4.id, row2.id, row3.id, row5.id]
+
+
+@pytest.mark.field_created_by
+@pytest.mark.django_db
+def test_created_by_field_enhance_queryset_defers_unused_user_columns(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user(first_name="Test User")
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_created_by_field(table=table)
+
+    model = table.get_model()
+    model.objects.create(created_by=user)
+
+    with django_assert_num_queries(1):
+        row = model.objects.all().enhance_by_fields().get()
+        created_by = getattr(row, f"field_{field.id}")
+        assert created_by.id == user.id
+        assert created_by.first_name == "Test User"
+        assert created_by.email == user.email
+
+    assert {"password", "last_login", "date_joined"}.issubset(
+        created_by.get_deferred_fields()
+    )
@@ -39,6 +39,7 @@ def test_date_field_type_prepare_value(data_fixture):
 
     unprepared_datetime = datetime(2020, 4, 10, 12, 30, 30, tzinfo=utc)
     assert d.prepare_value_for_db(f, unprepared_datetime) == expected_datetime
+    assert d.prepare_value_for_db(f, unprepared_datetime) is unprepared_datetime
 
     unprepared_datetime = datetime(2020, 4, 10, 12, 30, 30)
     assert d.prepare_value_for_db(f, unprepared_datetime) == expected_datetime
@@ -50,6 +51,9 @@ def test_date_field_type_prepare_value(data_fixture):
     assert d.prepare_value_for_db(f, "2020-04-11") != expected_date
     assert d.prepare_value_for_db(f, "2020-04-10 12:30:30") == expected_datetime
     assert d.prepare_value_for_db(f, "2020-04-10 00:30:30 PM") == expected_datetime
+    assert d.prepare_value_for_db(f, "2020-04-10T12:30:30Z") == expected_datetime
+    assert d.prepare_value_for_db(f, "2020-04-10T12:30:30.000Z") == expected_datetime
+    assert d.prepare_value_for_db(f, "2020-04-10T14:30:30+02:00") == expected_datetime
 
     f = data_fixture.create_date_field(date_include_time=False, date_format="ISO")
     expected_date = date(2020, 4, 10)
@@ -741,3 +745,33 @@ def test_get_group_by_metadata_in_rows_with_date_field(data_fixture):
             ]
         )
     }
+
+
+@pytest.mark.django_db
+def test_date_field_type_get_export_value(data_fixture):
+    field = data_fixture.create_date_field(
+        date_include_time=True,
+        date_format="EU",
+        date_time_format="24",
+        date_force_timezone="Europe/Amsterdam",
+    )
+    field_object = {"field": field, "type": DateFieldType(), "name": field.db_column}
+    field_type = DateFieldType()
+
+    assert field_type.get_export_value(None, field_object) == ""
+    assert field_type.get_export_value(None, field_object, rich_value=True) is None
+    assert (
+        field_type.get_export_value(
+            datetime(2020, 4, 10, 12, 30, tzinfo=timezone.utc), field_object
+        )
+        == "10/04/2020 14:30"
+    )
+    assert (
+        field_type.get_export_value(
+            datetime(2020, 12, 10, 12, 30, tzinfo=timezone.utc), field_object
+        )
+        == "10/12/2020 13:30"
+    )
+    assert field_type.get_export_value(date(2020, 4, 10), field_object) == (
+        "10/04/2020 00:00"
+    )
@@ -6,6 +6,7 @@ from pytest_unordered import unordered
 from baserow.contrib.database.fields.actions import UpdateFieldActionType
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import DurationField
+from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.core.action.handler import ActionHandler
@@ -584,3 +585,38 @@ def test_get_group_by_metadata_in_rows_with_duration_field(data_fixture):
             ]
         )
     }
+
+
+@pytest.mark.field_duration
+@pytest.mark.django_db
+def test_duration_field_type_reuses_search_expression(data_fixture):
+    table = data_fixture.create_database_table()
+    field = data_fixture.create_duration_field(table=table, duration_format="h:mm:ss")
+    other_field = data_fixture.create_duration_field(
+        table=table, duration_format="h:mm:ss"
+    )
+    field_type = field_type_registry.get_by_model(field)
+    model = table.get_model()
+
+    expression = field_type.get_search_expression(field, model.objects.all())
+    assert field_type.get_search_expression(field, model.objects.all()) is expression
+    assert field_type.get_search_expression(other_field, model.objects.all()) is not (
+        expression
+    )
+
+
+@pytest.mark.field_duration
+@pytest.mark.django_db
+def test_duration_field_type_get_export_value(data_fixture):
+    field = data_fixture.create_duration_field(duration_format="h:mm:ss")
+    field_type = field_type_registry.get_by_model(field)
+    field_object = {"field": field, "type": field_type, "name": field.db_column}
+
+    assert field_type.get_export_value(None, field_object) is None
+    assert field_type.get_export_value(timedelta(seconds=0), field_object) == "0:00:00"
+    assert (
+        field_type.get_export_value(
+            timedelta(hours=25, minutes=3, seconds=7), field_object
+        )
+        == "25:03:07"
+    )
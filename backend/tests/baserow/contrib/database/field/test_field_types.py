@@ -729,6 +729,30 @@ def test_field_types_with_get_value_for_filter_have_get_order():
             )
 
 
+def test_regex_field_types_reuse_their_validator():
+    for field_type_name in ["url", "email", "phone_number"]:
+        field_type = field_type_registry.get(field_type_name)
+        assert field_type.validator is field_type.validator
+
+
+def test_regex_field_type_prepare_value_for_db_in_bulk():
+    field_type = field_type_registry.get("email")
+
+    values = field_type.prepare_value_for_db_in_bulk(
+        None,
+        {1: "bram@baserow.io", 2: None, 3: "", 4: "not-an-email"},
+        continue_on_error=True,
+    )
+
+    assert values[1] == "bram@baserow.io"
+    assert values[2] == ""
+    assert values[3] == ""
+    assert isinstance(values[4], ValidationError)
+
+    with pytest.raises(ValidationError):
+        field_type.prepare_value_for_db_in_bulk(None, {1: "not-an-email"})
+
+
 @pytest.mark.django_db
 def test_text_field_type_get_order(data_fixture):
     user = data_fixture.create_user()
@@ -1,6 +1,7 @@
 from io import BytesIO
 
 from django.apps.registry import apps
+from django.core.exceptions import ValidationError
 from django.db import connections
 from django.shortcuts import reverse
 
@@ -528,6 +529,61 @@ def test_link_row_enhance_queryset(data_fixture, django_assert_num_queries):
             list(getattr(row, f"field_{link_row_field.id}").all())
 
 
+@pytest.mark.django_db
+@pytest.mark.field_link_row
+def test_link_row_serialize_to_input_value(data_fixture, django_assert_num_queries):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user, name="Placeholder")
+    example_table = data_fixture.create_database_table(
+        name="Example", database=database
+    )
+    customers_table = data_fixture.create_database_table(
+        name="Customers", database=database
+    )
+
+    link_row_field = FieldHandler().create_field(
+        user=user,
+        table=example_table,
+        name="Link Row",
+        type_name="link_row",
+        link_row_table=customers_table,
+    )
+    field_name = f"field_{link_row_field.id}"
+    link_row_field_type = field_type_registry.get("link_row")
+
+    row_handler = RowHandler()
+    customers_row_1 = row_handler.create_row(user=user, table=customers_table)
+    customers_row_2 = row_handler.create_row(user=user, table=customers_table)
+    row = row_handler.create_row(
+        user=user,
+        table=example_table,
+        values={field_name: [customers_row_2.id, customers_row_1.id]},
+    )
+
+    model = example_table.get_model()
+    row = model.objects.get(id=row.id)
+    expected_ids = [r.id for r in getattr(row, field_name).all()]
+    assert sorted(expected_ids) == [customers_row_1.id, customers_row_2.id]
+
+    row = model.objects.get(id=row.id)
+    with django_assert_num_queries(1):
+        assert (
+            link_row_field_type.serialize_to_input_value(
+                link_row_field, getattr(row, field_name)
+            )
+            == expected_ids
+        )
+
+    row = model.objects.all().enhance_by_fields().get(id=row.id)
+    with django_assert_num_queries(0):
+        assert (
+            link_row_field_type.serialize_to_input_value(
+                link_row_field, getattr(row, field_name)
+            )
+            == expected_ids
+        )
+
+
 @pytest.mark.django_db
 @pytest.mark.field_link_row
 def test_link_row_field_type_api_views(api_client, data_fixture):
@@ -1805,3 +1861,76 @@ def test_link_row_are_row_values_equal(data_fixture, django_assert_num_queries):
             LinkRowFieldType().are_row_values_equal([table2_row1.id], [table2_row2.id])
             is False
         )
+
+
+@pytest.mark.django_db
+@pytest.mark.field_link_row
+def test_link_row_prepare_value_for_db_first_row_wins_on_duplicate_names(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    related_table = data_fixture.create_database_table(database=database)
+    primary_field = data_fixture.create_text_field(
+        table=related_table, name="Name", primary=True
+    )
+    link_row_field = FieldHandler().create_field(
+        user=user,
+        table=table,
+        name="Link Row",
+        type_name="link_row",
+        link_row_table=related_table,
+    )
+
+    row_handler = RowHandler()
+    related_row_1 = row_handler.create_row(
+        user=user, table=related_table, values={primary_field.db_column: "Jane"}
+    )
+    row_handler.create_row(
+        user=user, table=related_table, values={primary_field.db_column: "Jane"}
+    )
+    related_row_3 = row_handler.create_row(
+        user=user, table=related_table, values={primary_field.db_column: "John"}
+    )
+
+    link_row_field_type = field_type_registry.get("link_row")
+    assert link_row_field_type.prepare_value_for_db_in_bulk(
+        link_row_field, {0: ["Jane"], 1: ["John", "Jane", related_row_1.id]}
+    ) == {0: [related_row_1.id], 1: [related_row_3.id, related_row_1.id]}
+
+
+@pytest.mark.django_db
+@pytest.mark.field_link_row
+def test_link_row_prepare_value_for_db_names_with_multiple_select_primary(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    related_table = data_fixture.create_database_table(database=database)
+    data_fixture.create_multiple_select_field(
+        table=related_table, name="Name", primary=True
+    )
+    link_row_field = FieldHandler().create_field(
+        user=user,
+        table=table,
+        name="Link Row",
+        type_name="link_row",
+        link_row_table=related_table,
+    )
+    related_row = RowHandler().create_row(user=user, table=related_table)
+
+    link_row_field_type = field_type_registry.get("link_row")
+    result = link_row_field_type.prepare_value_for_db_in_bulk(
+        link_row_field,
+        {0: ["Jane"], 1: [related_row.id]},
+        continue_on_error=True,
+    )
+
+    assert isinstance(result[0], ValidationError)
+    assert result[0].code == "invalid_value"
+    assert result[1] == [related_row.id]
+
+    with pytest.raises(ValidationError):
+        link_row_field_type.prepare_value_for_db_in_bulk(link_row_field, {0: ["Jane"]})
@@ -1,6 +1,7 @@
 from decimal import Decimal
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
 
 import pytest
 
@@ -211,6 +212,53 @@ def test_import_export_number_field(data_fixture):
     )
 
 
+def test_number_field_prepare_value_for_db_in_bulk():
+    field_type = field_type_registry.get("number")
+    field = NumberField(id=1, number_negative=False, number_decimal_places=2)
+
+    values = field_type.prepare_value_for_db_in_bulk(
+        field, {1: "1.5", 2: None, 3: -2, 4: 3}, continue_on_error=True
+    )
+
+    assert values[1] == Decimal("1.5")
+    assert values[2] is None
+    assert isinstance(values[3], ValidationError)
+    assert values[4] == Decimal("3")
+
+    with pytest.raises(ValidationError):
+        field_type.prepare_value_for_db_in_bulk(field, {1: "1", 2: "-1"})
+
+    field.number_negative = True
+    assert field_type.prepare_value_for_db(field, "-1.25") == Decimal("-1.25")
+
+    value = Decimal("2.5")
+    assert field_type.prepare_value_for_db(field, value) is value
+    assert field_type.prepare_value_for_db(field, 2) == Decimal("2")
+
+
+def test_number_field_get_export_value():
+    field_type = field_type_registry.get("number")
+    integer_field = NumberField(number_negative=True, number_decimal_places=0)
+    decimal_field = NumberField(number_negative=False, number_decimal_places=2)
+
+    assert field_type.get_export_value(None, {"field": decimal_field}) == ""
+    assert field_type.get_export_value(None, {"field": decimal_field}, True) is None
+    assert field_type.get_export_value(Decimal("-10"), {"field": integer_field}) == -10
+    assert field_type.get_export_value(Decimal("1.5"), {"field": decimal_field}) == (
+        "1.50"
+    )
+    assert field_type.get_export_value(Decimal("2.125"), {"field": decimal_field}) == (
+        "2.12"
+    )
+    assert field_type.get_export_value(2.5, {"field": decimal_field}) == "2.50"
+
+    large_field = NumberField(number_negative=True, number_decimal_places=10)
+    large_value = Decimal("-" + "9" * 50 + ".1234567891")
+    assert field_type.get_export_value(large_value, {"field": large_field}) == str(
+        large_value
+    )
+
+
 @pytest.mark.django_db
 def test_content_type_still_set_when_save_overridden(data_fixture):
     table = data_fixture.create_database_table()
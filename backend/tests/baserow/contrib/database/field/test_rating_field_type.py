@@ -7,6 +7,7 @@ from faker import Faker
 
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import RatingField
+from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.handler import RowHandler
 
 
@@ -120,6 +121,24 @@ def test_row_creation(data_fixture):
             )
 
 
+def test_rating_field_prepare_value_for_db_in_bulk():
+    field_type = field_type_registry.get("rating")
+    field = RatingField(max_value=5)
+
+    values = field_type.prepare_value_for_db_in_bulk(
+        field, {1: 3, 2: None, 3: -1, 4: 6, 5: "5"}, continue_on_error=True
+    )
+
+    assert values[1] == 3
+    assert values[2] == 0
+    assert values[3].code == "min_value"
+    assert values[4].code == "max_value"
+    assert values[5] == 5
+
+    with pytest.raises(ValidationError):
+        field_type.prepare_value_for_db_in_bulk(field, {1: 1, 2: 6})
+
+
 @pytest.mark.django_db
 def test_rating_field_modification(data_fixture):
     user = data_fixture.create_user()
@@ -91,6 +91,21 @@ def test_specific_iterator(data_fixture, django_assert_num_queries):
         assert specific_objects[5].id == long_text_field_3.id
 
 
+@pytest.mark.django_db
+def test_specific_iterator_sets_specific_class(data_fixture):
+    text_field = data_fixture.create_text_field()
+    long_text_field = data_fixture.create_long_text_field()
+
+    base_queryset = Field.objects.filter(
+        id__in=[text_field.id, long_text_field.id]
+    ).order_by("id")
+
+    specific_objects = list(specific_iterator(base_queryset))
+
+    assert specific_objects[0].__dict__["specific_class"] is TextField
+    assert specific_objects[1].__dict__["specific_class"] is LongTextField
+
+
 @pytest.mark.django_db
 def test_specific_iterator_with_deleted_type(data_fixture, django_assert_num_queries):
     user = data_fixture.create_user()
@@ -161,6 +161,25 @@ def test_registry_get_by_model_returns_the_most_specific_value():
     assert registry.get_by_model(SubClassOfBaseFakeModel()) == subtype_of_base_app
 
 
+def test_registry_get_by_model_cache_is_cleared_when_registry_changes():
+    base_app = BaseFakeModelApplication()
+    subtype_of_base_app = SubClassOfBaseFakeModelApplication()
+    registry = TemporaryRegistry()
+    registry.register(base_app)
+
+    assert registry.get_by_model(SubClassOfBaseFakeModel) == base_app
+
+    registry.register(subtype_of_base_app)
+
+    assert registry.get_by_model(SubClassOfBaseFakeModel) == subtype_of_base_app
+
+    registry.unregister(subtype_of_base_app)
+    registry.unregister(base_app)
+
+    with pytest.raises(InstanceTypeDoesNotExist):
+        registry.get_by_model(SubClassOfBaseFakeModel)
+
+
 def test_api_exceptions_api_mixins():
     class FakeInstance(MapAPIExceptionsInstanceMixin, Instance):
         type = "fake_instance"